@@ -1,7 +1,10 @@
+import asyncio
+
 import httpx
 from pydantic import BaseModel
 
-from supabase_mcp.clients.base_http_client import AsyncHTTPClient
+from supabase_mcp.clients.base_http_client import AsyncHTTPClient, create_http_client
+from supabase_mcp.exceptions import APIClientError
 from supabase_mcp.logger import logger
 from supabase_mcp.settings import settings
 
@@ -10,6 +13,7 @@ class ApiRoutes:
     """Routes for the Query API"""
 
     FEATURES_ACCESS = "/features/{feature_name}/access"
+    FEATURES_ACCESS_BULK = "/features/access"
 
 
 class FeatureAccessRequest(BaseModel):
@@ -24,6 +28,12 @@ class FeatureAccessResponse(BaseModel):
     access_granted: bool
 
 
+class FeaturesAccessResponse(BaseModel):
+    """Response for the access to several features at once."""
+
+    features: dict[str, bool]
+
+
 class ApiClient(AsyncHTTPClient):
     """Client for communicating with the Query API server for premium features.
 
@@ -37,10 +47,12 @@ class ApiClient(AsyncHTTPClient):
         query_api_url: str | None = None,
     ):
         """Initialize the Query API client"""
+        super().__init__()
         self.query_api_key = query_api_key or settings.query_api_key
         self.query_api_url = query_api_url or settings.query_api_url
         self._check_api_key_set()
-        self.client: httpx.AsyncClient | None = None
+        # Whether the Query API serves the bulk feature access route, unknown until first used
+        self.bulk_access_supported: bool | None = None
         logger.info(
             f"✔️ Query API client initialized successfully with URL: {self.query_api_url}, with key: {bool(self.query_api_key)}"
         )
@@ -53,10 +65,10 @@ class ApiClient(AsyncHTTPClient):
         """
         if self.client is None:
             logger.info("Creating new Query API client")
-            self.client = httpx.AsyncClient(
+            self.client = create_http_client(
                 base_url=self.query_api_url,
                 headers={"X-API-Key": f"{self.query_api_key}"},
-                timeout=30.0,
+                settings=settings,
             )
         logger.info("Returning existing Query API client")
         return self.client
@@ -80,9 +92,49 @@ class ApiClient(AsyncHTTPClient):
             result = await self.execute_request(
                 method="GET",
                 path=ApiRoutes.FEATURES_ACCESS.format(feature_name=feature_name),
+                endpoint=f"GET {ApiRoutes.FEATURES_ACCESS}",
             )
             logger.debug(f"Feature access response: {result}")
             return FeatureAccessResponse.model_validate(result)
         except Exception as e:
             logger.error(f"Error checking feature access: {e}")
             raise e
+
+    async def check_features_access(self, feature_names: list[str]) -> dict[str, bool]:
+        """Check the access to several features in one request.
+
+        Falls back to concurrent per-feature checks if the Query API doesn't serve the bulk route.
+
+        Args:
+            feature_names: Names of the features to check
+
+        Returns:
+            Whether access is granted, per feature name
+        """
+        if self.bulk_access_supported is not False:
+            try:
+                result = await self.execute_request(
+                    method="GET",
+                    path=ApiRoutes.FEATURES_ACCESS_BULK,
+                    request_params={"features": ",".join(feature_names)},
+                )
+                self.bulk_access_supported = True
+                access = FeaturesAccessResponse.model_validate(result).features
+            except APIClientError as e:
+                if e.status_code not in (404, 405):
+                    raise
+                logger.info("Query API doesn't support bulk feature access checks, checking features one by one")
+                self.bulk_access_supported = False
+            else:
+                # Features missing from the response are unknown rather than denied, so check them one by one
+                missing = [feature_name for feature_name in feature_names if feature_name not in access]
+                if missing:
+                    access = {**access, **await self._check_features_individually(missing)}
+                return {feature_name: access[feature_name] for feature_name in feature_names}
+
+        return await self._check_features_individually(feature_names)
+
+    async def _check_features_individually(self, feature_names: list[str]) -> dict[str, bool]:
+        """Check the access to several features with concurrent per-feature requests."""
+        responses = await asyncio.gather(*(self.check_feature_access(name) for name in feature_names))
+        return {name: response.access_granted for name, response in zip(feature_names, responses, strict=True)}
@@ -1,33 +1,96 @@
 from abc import ABC, abstractmethod
+from functools import cache
+from importlib.util import find_spec
 from json.decoder import JSONDecodeError
 from typing import Any, TypeVar
 
 import httpx
-from pydantic import BaseModel
-from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from supabase_mcp.clients.http_middleware import (
+    ENDPOINT_EXTENSION,
+    EndpointStats,
+    HTTPMetrics,
+    Middleware,
+    RetryMiddleware,
+    SendRequest,
+    TimingMiddleware,
+    build_pipeline,
+)
 from supabase_mcp.exceptions import (
     APIClientError,
     APIConnectionError,
+    APIError,
     APIResponseError,
     APIServerError,
     UnexpectedError,
 )
 from supabase_mcp.logger import logger
+from supabase_mcp.settings import Settings
 
 T = TypeVar("T")
 
 
-# Helper function for retry decorator to safely log exceptions
-def log_retry_attempt(retry_state: RetryCallState) -> None:
-    """Log retry attempts with exception details if available."""
-    exception = retry_state.outcome.exception() if retry_state.outcome and retry_state.outcome.failed else None
-    exception_str = str(exception) if exception else "Unknown error"
-    logger.warning(f"Network error, retrying ({retry_state.attempt_number}/3): {exception_str}")
+@cache
+def http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    if find_spec("h2") is not None:
+        return True
+    logger.warning("HTTP/2 is enabled but the h2 package isn't installed, falling back to HTTP/1.1")
+    return False
+
+
+def create_http_client(base_url: str, headers: dict[str, str], settings: Settings) -> httpx.AsyncClient:
+    """Create an httpx client with the configured protocol, connection limits and timeouts.
+
+    With HTTP/2, concurrent requests to the same host are multiplexed over one connection instead of
+    each opening its own TLS session.
+
+    Args:
+        base_url: Base URL of the API
+        headers: Headers sent with every request
+        settings: Settings with the HTTP connection options
+
+    Returns:
+        Configured httpx client
+    """
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        http2=settings.http2 and http2_available(),
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.http_read_timeout, connect=settings.http_connect_timeout),
+    )
 
 
 class AsyncHTTPClient(ABC):
-    """Abstract base class for async HTTP clients."""
+    """Base class for async HTTP clients, sharing one request pipeline.
+
+    Requests are sent through the client's middleware, outermost first:
+    - Timing, recording per-endpoint latency histograms and response sizes in the client's metrics
+    - Middleware added with add_middleware, e.g. caching or rate limiting
+    - Retries of requests that failed with a network error
+    """
+
+    # Attempts of a request failing with a network error
+    NETWORK_RETRY_ATTEMPTS = 3
+
+    def __init__(self) -> None:
+        """Initialize the request pipeline and its metrics."""
+        self.client: httpx.AsyncClient | None = None
+        self.metrics = HTTPMetrics()
+        self.middleware: list[Middleware] = [
+            TimingMiddleware(self.metrics),
+            RetryMiddleware(attempts=self.NETWORK_RETRY_ATTEMPTS),
+        ]
+        self._pipeline: SendRequest | None = None
+
+    def get_metrics(self) -> dict[str, EndpointStats]:
+        """Return the latencies, errors and response sizes of the requests sent so far, per endpoint."""
+        return self.metrics.stats()
 
     @abstractmethod
     async def _ensure_client(self) -> httpx.AsyncClient:
@@ -46,23 +109,37 @@ class AsyncHTTPClient(ABC):
         """
         pass
 
+    def add_middleware(self, middleware: Middleware) -> None:
+        """Add a middleware to the request pipeline, inside the timing and outside the retries.
+
+        Args:
+            middleware: Callable receiving the request and the function sending it further down the pipeline
+        """
+        self.middleware.insert(len(self.middleware) - 1, middleware)
+        self._pipeline = None
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a request over the network, the innermost step of the pipeline."""
+        client = await self._ensure_client()
+        return await client.send(request)
+
     def prepare_request(
         self,
-        client: httpx.AsyncClient,
         method: str,
         path: str,
         request_params: dict[str, Any] | None = None,
         request_body: dict[str, Any] | None = None,
+        endpoint: str | None = None,
     ) -> httpx.Request:
         """
         Prepare an HTTP request.
 
         Args:
-            client: The httpx client to use
             method: HTTP method (GET, POST, etc.)
             path: API path
             request_params: Query parameters
             request_body: Request body
+            endpoint: Endpoint the request is accounted to in the metrics, defaults to the method and path
 
         Returns:
             Prepared httpx.Request object
@@ -71,47 +148,53 @@ class AsyncHTTPClient(ABC):
             APIClientError: If request preparation fails
         """
         try:
-            return client.build_request(method=method, url=path, params=request_params, json=request_body)
+            if self.client is None:
+                raise RuntimeError("HTTP client is not initialized")
+            request = self.client.build_request(method=method, url=path, params=request_params, json=request_body)
         except Exception as e:
             raise APIClientError(
                 message=f"Failed to build request: {str(e)}",
                 status_code=None,
             ) from e
+        if endpoint:
+            request.extensions[ENDPOINT_EXTENSION] = endpoint
+        return request
 
-    @retry(
-        retry=retry_if_exception_type(httpx.NetworkError),  # This includes ConnectError and TimeoutException
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,  # Ensure the original exception is raised
-        before_sleep=log_retry_attempt,
-    )
-    async def send_request(self, client: httpx.AsyncClient, request: httpx.Request) -> httpx.Response:
+    async def send_request(self, request: httpx.Request) -> httpx.Response:
         """
-        Send an HTTP request with retry logic for transient errors.
+        Send an HTTP request through the middleware pipeline.
 
         Args:
-            client: The httpx client to use
             request: Prepared httpx.Request object
 
         Returns:
             httpx.Response object
 
         Raises:
-            APIConnectionError: For connection issues
+            APIConnectionError: For connection issues and timeouts
             APIClientError: For other request errors
         """
+        if self._pipeline is None:
+            self._pipeline = build_pipeline(self.middleware, self._send)
         try:
-            return await client.send(request)
+            return await self._pipeline(request)
         except httpx.NetworkError as e:
-            # All NetworkErrors will be retried by the decorator
-            # This will only be reached after all retries are exhausted
+            # Network errors are only raised here once the retry middleware gave up
             logger.error(f"Network error after all retry attempts: {str(e)}")
             raise APIConnectionError(
-                message=f"Network error after 3 retry attempts: {str(e)}",
+                message=f"Network error after {self.NETWORK_RETRY_ATTEMPTS} retry attempts: {str(e)}",
                 status_code=None,
             ) from e
+        except httpx.TimeoutException as e:
+            logger.error(f"Request timed out: {str(e)}")
+            raise APIConnectionError(
+                message=f"Request timed out: {str(e)}",
+                status_code=None,
+            ) from e
+        except APIError:
+            # Raised by middleware, e.g. a rate limit
+            raise
         except Exception as e:
-            # Other exceptions won't be retried
             raise APIClientError(
                 message=f"Request failed: {str(e)}",
                 status_code=None,
@@ -187,7 +270,8 @@ class AsyncHTTPClient(ABC):
         path: str,
         request_params: dict[str, Any] | None = None,
         request_body: dict[str, Any] | None = None,
-    ) -> dict[str, Any] | BaseModel:
+        endpoint: str | None = None,
+    ) -> dict[str, Any]:
         """
         Execute an HTTP request.
 
@@ -196,6 +280,7 @@ class AsyncHTTPClient(ABC):
             path: API path
             request_params: Query parameters
             request_body: Request body
+            endpoint: Endpoint the request is accounted to in the metrics, e.g. "GET /v1/projects/{ref}"
 
         Returns:
             API response as a dictionary
@@ -213,14 +298,14 @@ class AsyncHTTPClient(ABC):
         if request_body:
             logger.debug(f"Request body: {request_body}")
 
-        # Get client
-        client = await self._ensure_client()
+        # Make sure the client exists
+        await self._ensure_client()
 
         # Prepare request
-        request = self.prepare_request(client, method, path, request_params, request_body)
+        request = self.prepare_request(method, path, request_params, request_body, endpoint)
 
         # Send request
-        response = await self.send_request(client, request)
+        response = await self.send_request(request)
 
         # Parse response (for both success and error cases)
         parsed_body = self.parse_response(response)
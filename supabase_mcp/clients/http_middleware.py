@@ -0,0 +1,155 @@
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+from pydantic import BaseModel, Field
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from supabase_mcp.logger import logger
+
+# Sends a request further down the pipeline and returns its response
+SendRequest = Callable[[httpx.Request], Awaitable[httpx.Response]]
+# Wraps sending a request, e.g. to retry, cache, rate limit or time it
+Middleware = Callable[[httpx.Request, SendRequest], Awaitable[httpx.Response]]
+
+# Request extension holding the endpoint a request is accounted to in the metrics
+ENDPOINT_EXTENSION = "endpoint"
+
+# Upper bounds of the latency histogram buckets in milliseconds, slower requests fall into the last bucket
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def build_pipeline(middleware: list[Middleware], send: SendRequest) -> SendRequest:
+    """Chain middleware around a send function, the first middleware being the outermost.
+
+    Args:
+        middleware: Middleware in the order they see a request
+        send: Function sending the request over the network
+
+    Returns:
+        Function sending a request through all middleware
+    """
+
+    def wrap(layer: Middleware, call_next: SendRequest) -> SendRequest:
+        return lambda request: layer(request, call_next)
+
+    pipeline = send
+    for layer in reversed(middleware):
+        pipeline = wrap(layer, pipeline)
+    return pipeline
+
+
+class EndpointStats(BaseModel):
+    """Latency histogram and response sizes of the requests to one API endpoint."""
+
+    requests: int = Field(default=0, description="Number of requests sent")
+    errors: int = Field(default=0, description="Number of requests that failed or got an error status")
+    latency_buckets: dict[str, int] = Field(
+        default_factory=lambda: dict.fromkeys([*map(str, LATENCY_BUCKETS_MS), "+Inf"], 0),
+        description="Number of requests per latency bucket, keyed by the bucket's upper bound in milliseconds",
+    )
+    total_latency_ms: float = Field(default=0.0, description="Sum of the request latencies")
+    max_latency_ms: float = Field(default=0.0, description="Slowest request latency")
+    response_bytes: int = Field(default=0, description="Sum of the response body sizes")
+    max_response_bytes: int = Field(default=0, description="Largest response body size")
+
+
+class HTTPMetrics:
+    """Per-endpoint request metrics of an HTTP API client.
+
+    Requests are accounted to the endpoint set in their extensions (e.g. "GET /v1/projects/{ref}"), so
+    requests to different resources of the same route share a histogram, or else to their method and path.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._endpoints: dict[str, EndpointStats] = {}
+
+    def record(self, endpoint: str, latency_seconds: float, response: httpx.Response | None) -> None:
+        """Record a sent request.
+
+        Args:
+            endpoint: Endpoint the request is accounted to
+            latency_seconds: Time until the response was received or the request failed
+            response: The response, or None if the request failed
+        """
+        stats = self._endpoints.setdefault(endpoint, EndpointStats())
+        latency_ms = latency_seconds * 1000
+        stats.requests += 1
+        stats.total_latency_ms += latency_ms
+        stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+        bucket = next((str(bound) for bound in LATENCY_BUCKETS_MS if latency_ms <= bound), "+Inf")
+        stats.latency_buckets[bucket] += 1
+        if response is None or response.is_error:
+            stats.errors += 1
+        if response is not None:
+            size = len(response.content)
+            stats.response_bytes += size
+            stats.max_response_bytes = max(stats.max_response_bytes, size)
+
+    def stats(self) -> dict[str, EndpointStats]:
+        """Return a copy of the metrics per endpoint."""
+        return {endpoint: stats.model_copy(deep=True) for endpoint, stats in self._endpoints.items()}
+
+    def clear(self) -> None:
+        """Remove all recorded metrics."""
+        self._endpoints.clear()
+
+
+class TimingMiddleware:
+    """Records the latency and response size of every request in the client's metrics."""
+
+    def __init__(self, metrics: HTTPMetrics) -> None:
+        """Initialize the middleware.
+
+        Args:
+            metrics: Metrics the requests are recorded in
+        """
+        self.metrics = metrics
+
+    async def __call__(self, request: httpx.Request, call_next: SendRequest) -> httpx.Response:
+        endpoint = request.extensions.get(ENDPOINT_EXTENSION) or f"{request.method} {request.url.path}"
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await call_next(request)
+            return response
+        finally:
+            self.metrics.record(endpoint, time.perf_counter() - start, response)
+
+
+# Helper function for the retry middleware to safely log exceptions
+def log_retry_attempt(retry_state: RetryCallState) -> None:
+    """Log retry attempts with exception details if available."""
+    exception = retry_state.outcome.exception() if retry_state.outcome and retry_state.outcome.failed else None
+    exception_str = str(exception) if exception else "Unknown error"
+    max_attempts = getattr(retry_state.retry_object.stop, "max_attempt_number", "?")
+    logger.warning(f"Network error, retrying ({retry_state.attempt_number}/{max_attempts}): {exception_str}")
+
+
+class RetryMiddleware:
+    """Retries requests that failed with a network error, e.g. a refused or dropped connection."""
+
+    def __init__(self, attempts: int = 3, min_wait: float = 2.0, max_wait: float = 10.0) -> None:
+        """Initialize the middleware.
+
+        Args:
+            attempts: Maximum number of attempts of a request
+            min_wait: Minimum seconds to wait before a retry
+            max_wait: Maximum seconds to wait before a retry
+        """
+        self.attempts = attempts
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+
+    async def __call__(self, request: httpx.Request, call_next: SendRequest) -> httpx.Response:
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(httpx.NetworkError),
+            stop=stop_after_attempt(self.attempts),
+            wait=wait_exponential(multiplier=1, min=self.min_wait, max=self.max_wait),
+            reraise=True,  # Ensure the original exception is raised
+            before_sleep=log_retry_attempt,
+        ):
+            with attempt:
+                return await call_next(request)
+        raise AssertionError("AsyncRetrying either returns the response or reraises the last error")
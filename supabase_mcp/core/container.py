@@ -5,11 +5,15 @@ from mcp.server.fastmcp import FastMCP
 from supabase_mcp.clients.api_client import ApiClient
 from supabase_mcp.clients.management_client import ManagementAPIClient
 from supabase_mcp.clients.sdk_client import SupabaseSDKClient
+from supabase_mcp.core.feature_access_cache import FeatureAccessCache
 from supabase_mcp.core.feature_manager import FeatureManager
 from supabase_mcp.logger import logger
 from supabase_mcp.services.api.api_manager import SupabaseApiManager
+from supabase_mcp.services.database.catalog_cache import CatalogCache, CatalogObject
 from supabase_mcp.services.database.postgres_client import PostgresClient
 from supabase_mcp.services.database.query_manager import QueryManager
+from supabase_mcp.services.database.sql.loader import SQLLoader
+from supabase_mcp.services.database.sql.validator import SQLValidator
 from supabase_mcp.services.logs.log_manager import LogManager
 from supabase_mcp.services.safety.safety_manager import SafetyManager
 from supabase_mcp.settings import Settings
@@ -55,6 +59,18 @@ class ServicesContainer:
             cls._instance = cls()
         return cls._instance
 
+    @staticmethod
+    def catalog_ttls(settings: Settings) -> dict[CatalogObject, float]:
+        """Map each kind of catalog metadata to the TTL configured for it, if any"""
+        ttls = {
+            CatalogObject.SCHEMAS: settings.catalog_cache_schemas_ttl,
+            CatalogObject.TABLES: settings.catalog_cache_tables_ttl,
+            CatalogObject.TABLES_FAST: settings.catalog_cache_tables_ttl,
+            CatalogObject.TABLE_SCHEMA: settings.catalog_cache_table_schema_ttl,
+            CatalogObject.TABLE_SCHEMAS: settings.catalog_cache_table_schema_ttl,
+        }
+        return {kind: ttl for kind, ttl in ttls.items() if ttl is not None}
+
     def initialize_services(self, settings: Settings) -> None:
         """Initializes all services in a synchronous manner to satisfy MCP runtime requirements"""
         # Create clients
@@ -71,15 +87,34 @@ class ServicesContainer:
         self.query_manager = QueryManager(
             postgres_client=self.postgres_client,
             safety_manager=self.safety_manager,
+            sql_validator=SQLValidator(
+                cache_size=settings.sql_validation_cache_size,
+                offload_threshold=settings.sql_parse_offload_threshold,
+                max_workers=settings.sql_parse_workers,
+            ),
+            catalog_cache=CatalogCache(ttl=settings.catalog_cache_ttl, max_size=settings.catalog_cache_size),
+            catalog_ttls=self.catalog_ttls(settings),
+            default_limit=settings.query_default_limit,
         )
         self.tool_manager = ToolManager.get_instance()
 
+        # Read the SQL templates once, so building queries never touches the disk
+        SQLLoader.preload()
+
         # Register safety configs
         self.safety_manager.register_safety_configs()
 
         # Create query api client
         self.query_api_client = ApiClient()
-        self.feature_manager = FeatureManager(self.query_api_client)
+        self.feature_manager = FeatureManager(
+            self.query_api_client,
+            access_cache=FeatureAccessCache(
+                ttl=settings.feature_access_cache_ttl,
+                denied_ttl=settings.feature_access_denied_ttl,
+                stale_ttl=settings.feature_access_stale_ttl,
+            ),
+            speculative=settings.feature_access_speculative,
+        )
 
         logger.info("✓ All services initialized successfully.")
 
@@ -89,6 +124,14 @@ class ServicesContainer:
         if self.postgres_client:
             await self.postgres_client.close()
 
+        # SQL parser worker threads
+        if self.query_manager:
+            self.query_manager.validator.shutdown()
+
+        # Feature access refresh
+        if self.feature_manager:
+            await self.feature_manager.stop_access_refresh()
+
         # API clients
         if self.query_api_client:
             await self.query_api_client.close()
@@ -0,0 +1,94 @@
+import time
+
+
+class FeatureAccessCache:
+    """TTL cache of feature access decisions returned by the Query API.
+
+    Every tool call checks access to its feature, so decisions are kept in process for a while:
+    - Grants are kept for the grant TTL
+    - Denials are kept for the (shorter) denial TTL, so a new subscription is picked up quickly
+    - Expired grants stay available as stale grants up to the stale TTL, to keep granted features
+      working while the Query API is temporarily unreachable
+    """
+
+    def __init__(self, ttl: float = 300.0, denied_ttl: float = 60.0, stale_ttl: float = 3600.0) -> None:
+        """Initialize the feature access cache.
+
+        Args:
+            ttl: Seconds a granted access is trusted without asking the Query API, 0 disables caching
+            denied_ttl: Seconds a denied access is trusted without asking the Query API, 0 disables caching
+            stale_ttl: Seconds since it was stored that a grant may be used while the Query API is down
+        """
+        self.ttl = ttl
+        self.denied_ttl = denied_ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        # Values are the access decision, the time it was stored and its expiry time
+        self._entries: dict[str, tuple[bool, float, float]] = {}
+
+    def get(self, feature_name: str) -> bool | None:
+        """Look up a fresh access decision.
+
+        Args:
+            feature_name: Name of the feature
+
+        Returns:
+            Whether access is granted, or None if there is no fresh decision
+        """
+        entry = self._entries.get(feature_name)
+        if entry is not None and entry[2] > time.monotonic():
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return None
+
+    def get_stale_grant(self, feature_name: str) -> bool:
+        """Check whether a possibly expired grant can stand in while the Query API is unreachable.
+
+        Args:
+            feature_name: Name of the feature
+
+        Returns:
+            True if access was granted no longer than the stale TTL ago
+        """
+        entry = self._entries.get(feature_name)
+        if entry is None or not entry[0] or time.monotonic() - entry[1] >= self.stale_ttl:
+            return False
+        self.stale_hits += 1
+        return True
+
+    def put(self, feature_name: str, granted: bool, ttl: float | None = None) -> None:
+        """Store an access decision.
+
+        Grants are kept even when the grant TTL is 0, so they can still be used as stale grants.
+
+        Args:
+            feature_name: Name of the feature
+            granted: Whether access is granted
+            ttl: Time to live of this decision in seconds, defaults to the grant or denial TTL
+        """
+        if ttl is None:
+            ttl = self.ttl if granted else self.denied_ttl
+        if granted or ttl > 0:
+            now = time.monotonic()
+            self._entries[feature_name] = (granted, now, now + ttl)
+        else:
+            self._entries.pop(feature_name, None)
+
+    def clear(self) -> None:
+        """Remove all decisions and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the feature access cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "size": len(self._entries),
+        }
@@ -1,9 +1,22 @@
+import asyncio
+from collections.abc import Coroutine
 from typing import TYPE_CHECKING, Any, Literal
 
 from supabase_mcp.clients.api_client import ApiClient
-from supabase_mcp.exceptions import APIError, ConfirmationRequiredError, FeatureAccessError, FeatureTemporaryError
+from supabase_mcp.clients.http_middleware import EndpointStats
+from supabase_mcp.core.feature_access_cache import FeatureAccessCache
+from supabase_mcp.exceptions import (
+    APIConnectionError,
+    APIError,
+    APIServerError,
+    ConfirmationRequiredError,
+    FeatureAccessError,
+    FeatureTemporaryError,
+)
 from supabase_mcp.logger import logger
-from supabase_mcp.services.database.postgres_client import QueryResult
+from supabase_mcp.services.database.catalog_cache import CatalogObject
+from supabase_mcp.services.database.pool_monitor import PoolStats
+from supabase_mcp.services.database.postgres_client import QueryResult, ResultFormat
 from supabase_mcp.services.safety.models import ClientType, SafetyMode
 from supabase_mcp.tools.manager import ToolName
 
@@ -14,46 +27,196 @@ if TYPE_CHECKING:
 class FeatureManager:
     """Service for managing features, access to them and their configuration."""
 
-    def __init__(self, api_client: ApiClient):
+    # Tools that are covered by the feature access of another tool
+    FEATURE_ALIASES: dict[ToolName, ToolName] = {
+        ToolName.GET_TABLE_SCHEMAS: ToolName.GET_TABLE_SCHEMA,
+    }
+
+    # Tools without side effects, which can start their work before their feature access is confirmed
+    READ_ONLY_TOOLS: frozenset[ToolName] = frozenset(
+        {
+            ToolName.GET_SCHEMAS,
+            ToolName.GET_TABLES,
+            ToolName.GET_TABLE_SCHEMA,
+            ToolName.GET_TABLE_SCHEMAS,
+            ToolName.RETRIEVE_MIGRATIONS,
+            ToolName.GET_MANAGEMENT_API_SPEC,
+            ToolName.GET_AUTH_ADMIN_METHODS_SPEC,
+            ToolName.RETRIEVE_LOGS,
+        }
+    )
+
+    # Local diagnostics of the server itself, which aren't features and run without an access check
+    UNGATED_TOOLS: frozenset[ToolName] = frozenset({ToolName.GET_POOL_STATS, ToolName.GET_API_STATS})
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        access_cache: FeatureAccessCache | None = None,
+        speculative: bool = True,
+    ):
         """Initialize the feature service.
 
         Args:
             api_client: Client for communicating with the API
+            access_cache: Cache of access decisions, defaults to a cache with the default TTLs
+            speculative: Whether read-only tools run concurrently with their feature access check
         """
         self.api_client = api_client
+        self.access_cache = access_cache or FeatureAccessCache()
+        self.speculative = speculative
+        # Access checks in flight, shared by concurrent checks of the same feature
+        self._pending_checks: dict[str, asyncio.Task[bool]] = {}
+        # Bulk access check in flight and the background task refreshing the access map
+        self._prefetch_task: asyncio.Task[None] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def feature_names(cls) -> list[str]:
+        """Names of the features whose access is checked by the tools."""
+        return list(
+            dict.fromkeys(
+                cls.FEATURE_ALIASES.get(tool, tool).value for tool in ToolName if tool not in cls.UNGATED_TOOLS
+            )
+        )
+
+    async def prefetch_feature_access(self, ttl: float | None = None) -> None:
+        """Load the access to every feature in one Query API request into the access cache.
+
+        Failures are logged and leave the cache as is, features are then checked one by one.
+
+        Args:
+            ttl: Time to live of the loaded grants in seconds, defaults to the cache's grant TTL. Denials
+                always use the cache's denial TTL, so a new subscription is picked up quickly.
+        """
+        try:
+            access_map = await self.api_client.check_features_access(self.feature_names())
+        except Exception as e:
+            logger.warning(f"Couldn't prefetch feature access: {e}")
+            return
+        for feature_name, granted in access_map.items():
+            self.access_cache.put(feature_name, granted, ttl if granted else None)
+        logger.debug(f"Prefetched access to {len(access_map)} features")
+
+    def start_access_refresh(self, interval: float) -> None:
+        """Start prefetching the feature access in the background, then refresh it every interval.
+
+        Refreshed grants live for two intervals, so a single failed refresh doesn't expire them and
+        tool calls only find them in the cache. If the Query API has no bulk access route, the refresh stops
+        after the first prefetch rather than checking every feature one by one each interval, and features
+        are then checked when their tools are called.
+
+        Args:
+            interval: Seconds between two refreshes, 0 only prefetches once
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_access(interval))
+
+    async def _refresh_access(self, interval: float) -> None:
+        ttl = 2 * interval if interval > 0 else None
+        while True:
+            self._prefetch_task = asyncio.create_task(self.prefetch_feature_access(ttl))
+            await self._prefetch_task
+            if interval <= 0:
+                return
+            if self.api_client.bulk_access_supported is False:
+                logger.debug("Bulk feature access checks aren't supported, stopping the access refresh")
+                return
+            await asyncio.sleep(interval)
+
+    async def stop_access_refresh(self) -> None:
+        """Stop the background refresh of the feature access."""
+        for task in (self._refresh_task, self._prefetch_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._refresh_task = None
+        self._prefetch_task = None
 
     async def check_feature_access(self, feature_name: str) -> None:
         """Check if the user has access to a feature.
 
+        Decisions are served from the access cache while fresh, which the background refresh keeps filled.
+        Otherwise concurrent checks of the same feature share a single Query API request.
+
         Args:
             feature_name: Name of the feature to check
 
         Raises:
             FeatureAccessError: If the user doesn't have access to the feature
+            FeatureTemporaryError: If the Query API couldn't be reached and there is no recent grant
         """
-        try:
-            # Use the API client to check feature access
-            response = await self.api_client.check_feature_access(feature_name)
+        granted = self.access_cache.get(feature_name)
+        if granted is None and self._prefetch_task is not None and not self._prefetch_task.done():
+            # The access map is being loaded, e.g. the first tool call right after startup
+            await asyncio.shield(self._prefetch_task)
+            granted = self.access_cache.get(feature_name)
+        if granted is None:
+            task = self._pending_checks.get(feature_name)
+            if task is None:
+                task = asyncio.create_task(self._fetch_feature_access(feature_name))
+                self._pending_checks[feature_name] = task
+                task.add_done_callback(lambda done: self._on_check_done(feature_name, done))
+            # Shielded so a cancelled caller doesn't cancel the request other callers are waiting for
+            granted = await asyncio.shield(task)
+
+        if not granted:
+            logger.info(f"Feature access denied: {feature_name}")
+            raise FeatureAccessError(feature_name)
+
+        logger.debug(f"Feature access granted: {feature_name}")
+
+    def _on_check_done(self, feature_name: str, task: "asyncio.Task[bool]") -> None:
+        if self._pending_checks.get(feature_name) is task:
+            del self._pending_checks[feature_name]
+        # Mark the error as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_feature_access(self, feature_name: str) -> bool:
+        """Ask the Query API for access to a feature and cache the decision.
+
+        Falls back to a recent grant when the Query API can't be reached or fails on its side, but not when it
+        rejects the request, e.g. because the API key was revoked.
 
-            # If access is not granted, raise an exception
-            if not response.access_granted:
-                logger.info(f"Feature access denied: {feature_name}")
-                raise FeatureAccessError(feature_name)
+        Args:
+            feature_name: Name of the feature to check
 
-            logger.debug(f"Feature access granted: {feature_name}")
+        Returns:
+            Whether access is granted
 
+        Raises:
+            FeatureTemporaryError: If the Query API rejected the request, or couldn't be reached and there is
+                no recent grant
+        """
+        try:
+            # Use the API client to check feature access
+            response = await self.api_client.check_feature_access(feature_name)
+        except (APIConnectionError, APIServerError) as e:
+            if self.access_cache.get_stale_grant(feature_name):
+                logger.warning(f"Couldn't check feature access, using the last grant: {feature_name} - {e}")
+                return True
+            logger.error(f"API error checking feature access: {feature_name} - {e}")
+            raise FeatureTemporaryError(feature_name, e.status_code, e.response_body) from e
         except APIError as e:
             logger.error(f"API error checking feature access: {feature_name} - {e}")
             raise FeatureTemporaryError(feature_name, e.status_code, e.response_body) from e
         except Exception as e:
-            if not isinstance(e, FeatureAccessError):
-                logger.error(f"Unexpected error checking feature access: {feature_name} - {e}")
-                raise FeatureTemporaryError(feature_name) from e
-            raise
+            logger.error(f"Unexpected error checking feature access: {feature_name} - {e}")
+            raise FeatureTemporaryError(feature_name) from e
+
+        self.access_cache.put(feature_name, response.access_granted)
+        return response.access_granted
 
     async def execute_tool(self, tool_name: ToolName, services_container: "ServicesContainer", **kwargs: Any) -> Any:
         """Execute a tool with feature access check.
 
+        Read-only tools start their work while the access is checked, other tools wait for the check.
+        Ungated tools run without a check.
+
         Args:
             tool_name: Name of the tool to execute
             services_container: Container with all services
@@ -62,24 +225,63 @@ class FeatureManager:
         Returns:
             Result of the tool execution
         """
+        if tool_name in self.UNGATED_TOOLS:
+            return await self._run_tool(tool_name, services_container, **kwargs)
+
+        feature_name = self.FEATURE_ALIASES.get(tool_name, tool_name).value
+        if self.speculative and tool_name in self.READ_ONLY_TOOLS:
+            return await self._execute_speculatively(
+                feature_name, self._run_tool(tool_name, services_container, **kwargs)
+            )
+
         # Check feature access
-        await self.check_feature_access(tool_name.value)
+        await self.check_feature_access(feature_name)
+        return await self._run_tool(tool_name, services_container, **kwargs)
+
+    async def _execute_speculatively(self, feature_name: str, work: Coroutine[Any, Any, Any]) -> Any:
+        """Run a read-only tool's work while its feature access is checked.
+
+        The result is only returned once access is confirmed, and the work is cancelled if it isn't.
+
+        Args:
+            feature_name: Name of the feature to check
+            work: The tool's work
+
+        Returns:
+            Result of the work
+        """
+        work_task = asyncio.create_task(work)
+        try:
+            await self.check_feature_access(feature_name)
+        except BaseException:
+            work_task.cancel()
+            # Let the work unwind, its own outcome doesn't matter anymore
+            await asyncio.gather(work_task, return_exceptions=True)
+            raise
+        return await work_task
 
-        # Execute the appropriate tool based on name
+    async def _run_tool(self, tool_name: ToolName, services_container: "ServicesContainer", **kwargs: Any) -> Any:
+        """Execute the appropriate tool based on name."""
         if tool_name == ToolName.GET_SCHEMAS:
             return await self.get_schemas(services_container)
         elif tool_name == ToolName.GET_TABLES:
             return await self.get_tables(services_container, **kwargs)
         elif tool_name == ToolName.GET_TABLE_SCHEMA:
             return await self.get_table_schema(services_container, **kwargs)
+        elif tool_name == ToolName.GET_TABLE_SCHEMAS:
+            return await self.get_table_schemas(services_container, **kwargs)
         elif tool_name == ToolName.EXECUTE_POSTGRESQL:
             return await self.execute_postgresql(services_container, **kwargs)
         elif tool_name == ToolName.RETRIEVE_MIGRATIONS:
             return await self.retrieve_migrations(services_container, **kwargs)
+        elif tool_name == ToolName.GET_POOL_STATS:
+            return await self.get_pool_stats(services_container)
         elif tool_name == ToolName.SEND_MANAGEMENT_API_REQUEST:
             return await self.send_management_api_request(services_container, **kwargs)
         elif tool_name == ToolName.GET_MANAGEMENT_API_SPEC:
             return await self.get_management_api_spec(services_container, **kwargs)
+        elif tool_name == ToolName.GET_API_STATS:
+            return await self.get_api_stats(services_container)
         elif tool_name == ToolName.GET_AUTH_ADMIN_METHODS_SPEC:
             return await self.get_auth_admin_methods_spec(services_container)
         elif tool_name == ToolName.CALL_AUTH_ADMIN_METHOD:
@@ -97,26 +299,67 @@ class FeatureManager:
         """List all database schemas with their sizes and table counts."""
         query_manager = container.query_manager
         query = query_manager.get_schemas_query()
-        return await query_manager.handle_query(query)
+        return await query_manager.handle_catalog_query(CatalogObject.SCHEMAS, query)
 
-    async def get_tables(self, container: "ServicesContainer", schema_name: str) -> QueryResult:
+    async def get_tables(
+        self,
+        container: "ServicesContainer",
+        schema_name: str,
+        result_format: Literal["rows", "columnar"] = "rows",
+        fast: bool = False,
+    ) -> QueryResult:
         """List all tables, foreign tables, and views in a schema with their sizes, row counts, and metadata."""
         query_manager = container.query_manager
-        query = query_manager.get_tables_query(schema_name)
-        return await query_manager.handle_query(query)
+        query = query_manager.get_tables_query(schema_name, fast=fast)
+        return await query_manager.handle_catalog_query(
+            CatalogObject.TABLES_FAST if fast else CatalogObject.TABLES,
+            query.query,
+            params=query.params,
+            schema_name=schema_name,
+            result_format=ResultFormat(result_format),
+        )
 
     async def get_table_schema(self, container: "ServicesContainer", schema_name: str, table: str) -> QueryResult:
         """Get detailed table structure including columns, keys, and relationships."""
         query_manager = container.query_manager
         query = query_manager.get_table_schema_query(schema_name, table)
-        return await query_manager.handle_query(query)
+        return await query_manager.handle_catalog_query(
+            CatalogObject.TABLE_SCHEMA, query.query, params=query.params, schema_name=schema_name, table=table
+        )
+
+    async def get_table_schemas(
+        self, container: "ServicesContainer", schema_name: str, tables: list[str] | None = None
+    ) -> QueryResult:
+        """Get the structure of several tables, or of every table in a schema, grouped per table."""
+        query_manager = container.query_manager
+        query = query_manager.get_table_schemas_query(schema_name, tables)
+        return await query_manager.handle_catalog_query(
+            CatalogObject.TABLE_SCHEMAS,
+            query.query,
+            params=query.params,
+            schema_name=schema_name,
+            table=",".join(sorted(tables)) if tables else None,
+            group_by="table_name",
+        )
 
     async def execute_postgresql(
-        self, container: "ServicesContainer", query: str, migration_name: str = ""
+        self,
+        container: "ServicesContainer",
+        query: str,
+        migration_name: str = "",
+        result_format: Literal["rows", "columnar"] = "rows",
+        timeout: float | None = None,
     ) -> QueryResult:
         """Execute PostgreSQL statements against your Supabase database."""
         query_manager = container.query_manager
-        return await query_manager.handle_query(query, has_confirmation=False, migration_name=migration_name)
+        return await query_manager.handle_query(
+            query,
+            has_confirmation=False,
+            migration_name=migration_name,
+            result_format=ResultFormat(result_format),
+            timeout=timeout,
+            apply_default_limit=True,
+        )
 
     async def retrieve_migrations(
         self,
@@ -131,7 +374,11 @@ class FeatureManager:
         query = query_manager.get_migrations_query(
             limit=limit, offset=offset, name_pattern=name_pattern, include_full_queries=include_full_queries
         )
-        return await query_manager.handle_query(query)
+        return await query_manager.handle_query(query.query, params=query.params)
+
+    async def get_pool_stats(self, container: "ServicesContainer") -> PoolStats:
+        """Get the usage and acquire latencies of the database connection pool."""
+        return container.postgres_client.get_pool_stats()
 
     async def send_management_api_request(
         self,
@@ -161,6 +408,13 @@ class FeatureManager:
         api_manager = container.api_manager
         return await api_manager.handle_spec_request(path, method, domain, all_paths)
 
+    async def get_api_stats(self, container: "ServicesContainer") -> dict[str, dict[str, EndpointStats]]:
+        """Get the request latencies, errors and response sizes of the HTTP API clients, per endpoint."""
+        return {
+            "management_api": container.api_manager.client.get_metrics(),
+            "query_api": container.query_api_client.get_metrics(),
+        }
+
     async def get_auth_admin_methods_spec(self, container: "ServicesContainer") -> dict[str, Any]:
         """Get Python SDK methods specification for Auth Admin."""
         sdk_client = container.sdk_client
@@ -25,6 +25,12 @@ class QueryError(DatabaseError):
     pass
 
 
+class QueryOutcomeUnknownError(ConnectionError):
+    """Raised when the connection is lost while a write may have been executed."""
+
+    pass
+
+
 class TimeoutError(DatabaseError):
     """Raised when a database operation times out."""
 
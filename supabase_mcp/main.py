@@ -19,6 +19,13 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[FastMCP, None]:
         services_container = ServicesContainer.get_instance()
         services_container.initialize_services(settings)
 
+        # Connect to the database while the tools register, without failing startup if it's unreachable
+        if settings.db_pool_warmup:
+            services_container.postgres_client.start_warmup()
+
+        # Load the access to all features in one request and keep it fresh in the background
+        services_container.feature_manager.start_access_refresh(settings.feature_access_refresh_interval)
+
         # Register tools
         mcp = ToolRegistry(mcp=app, services_container=services_container).register_tools()
         yield mcp
@@ -218,10 +218,12 @@ class SupabaseApiManager:
         self.safety_manager.validate_operation(ClientType.API, operation, has_confirmation=has_confirmation)
 
         # Replace path parameters in the path string with actual values
-        path = self.replace_path_params(path, path_params)
+        resolved_path = self.replace_path_params(path, path_params)
 
-        # Execute the request using the API client
-        return await self.client.execute_request(method, path, request_params, request_body)
+        # Execute the request using the API client, accounting it to the path template in the metrics
+        return await self.client.execute_request(
+            method, resolved_path, request_params, request_body, endpoint=f"{method} {path}"
+        )
 
     async def handle_confirmation(self, confirmation_id: str) -> dict[str, Any]:
         """Handle a confirmation request."""
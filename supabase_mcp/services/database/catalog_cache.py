@@ -0,0 +1,171 @@
+import time
+from collections import OrderedDict
+from enum import Enum
+
+from supabase_mcp.logger import logger
+from supabase_mcp.services.database.postgres_client import QueryResult, ResultFormat
+from supabase_mcp.services.database.sql.models import QueryValidationResults, SQLQueryCategory
+
+
+class CatalogObject(str, Enum):
+    """Kind of catalog metadata kept in the catalog cache."""
+
+    SCHEMAS = "schemas"  # List of all schemas
+    TABLES = "tables"  # Tables of one schema
+    TABLES_FAST = "tables_fast"  # Tables of one schema with estimated sizes and row counts
+    TABLE_SCHEMA = "table_schema"  # Columns of one table
+    TABLE_SCHEMAS = "table_schemas"  # Columns of several tables of one schema, grouped per table
+
+
+# Cache key: object kind, schema name, table name and result format
+CatalogKey = tuple[CatalogObject, str | None, str | None, ResultFormat]
+
+
+class CatalogCache:
+    """TTL cache of catalog metadata query results (schemas, tables, table structure).
+
+    Introspection queries are expensive and asked for repeatedly in a session, so their results are kept
+    for a limited time. Entries are dropped when a DDL statement touches their schema, and the least
+    recently used entry is evicted once the cache is full.
+    """
+
+    # Schema the validator reports when a statement doesn't name one explicitly
+    DEFAULT_SCHEMA = "public"
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 256) -> None:
+        """Initialize the catalog cache.
+
+        Args:
+            ttl: Default time to live of an entry in seconds, 0 disables caching
+            max_size: Maximum number of cached results
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Values are the cached result, the time it was stored and its expiry time
+        self._entries: OrderedDict[CatalogKey, tuple[QueryResult, float, float]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(
+        self,
+        kind: CatalogObject,
+        schema_name: str | None = None,
+        table: str | None = None,
+        result_format: ResultFormat = ResultFormat.ROWS,
+    ) -> QueryResult | None:
+        """Look up a cached result.
+
+        Args:
+            kind: Kind of catalog object
+            schema_name: Schema of the object, if any
+            table: Table of the object, if any
+            result_format: Shape of the rows in the result
+
+        Returns:
+            A copy of the cached result with its age set, or None if there is no fresh entry
+        """
+        if not self.enabled:
+            return None
+        key = (kind, schema_name, table, result_format)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is None or entry[2] <= now:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        result, stored_at, _ = entry
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result.model_copy(update={"cache_age_seconds": round(now - stored_at, 3)})
+
+    def put(
+        self,
+        result: QueryResult,
+        kind: CatalogObject,
+        schema_name: str | None = None,
+        table: str | None = None,
+        result_format: ResultFormat = ResultFormat.ROWS,
+        ttl: float | None = None,
+    ) -> None:
+        """Store a result, evicting the least recently used entry if the cache is full.
+
+        Args:
+            result: Result of the catalog query
+            kind: Kind of catalog object
+            schema_name: Schema of the object, if any
+            table: Table of the object, if any
+            result_format: Shape of the rows in the result
+            ttl: Time to live of this entry in seconds, defaults to the cache's TTL, 0 skips caching it
+        """
+        if not self.enabled or ttl == 0:
+            return
+        key = (kind, schema_name, table, result_format)
+        now = time.monotonic()
+        self._entries[key] = (result, now, now + (self.ttl if ttl is None else ttl))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, schema_name: str | None = None) -> None:
+        """Drop the entries of a schema, or all entries if no schema is given.
+
+        The schema list is always dropped, since it includes per-schema sizes and table counts.
+
+        Args:
+            schema_name: Schema whose entries are dropped
+        """
+        if schema_name is None:
+            self._entries.clear()
+            return
+        for key in list(self._entries):
+            kind, key_schema, _, _ = key
+            if kind == CatalogObject.SCHEMAS or key_schema == schema_name:
+                del self._entries[key]
+
+    def invalidate_for(self, validated_query: QueryValidationResults) -> None:
+        """Drop the entries affected by the DDL statements of an executed query.
+
+        The validator reports the default schema when a statement doesn't name one (e.g. views or
+        comments), so DDL on the default schema clears the whole cache to stay on the safe side.
+
+        Args:
+            validated_query: Validation result of the executed query
+        """
+        if not self._entries:
+            return
+        schemas = {
+            statement.schema_name
+            for statement in validated_query.statements
+            if statement.category == SQLQueryCategory.DDL
+        }
+        if not schemas:
+            return
+        if None in schemas or self.DEFAULT_SCHEMA in schemas:
+            logger.debug("DDL executed, clearing the catalog cache")
+            self.invalidate()
+            return
+        for schema_name in schemas:
+            logger.debug(f"DDL executed on schema {schema_name}, invalidating its catalog cache entries")
+            self.invalidate(schema_name)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the catalog cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
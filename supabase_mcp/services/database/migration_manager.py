@@ -2,6 +2,8 @@ import datetime
 import hashlib
 import re
 
+from pydantic import BaseModel, Field
+
 from supabase_mcp.logger import logger
 from supabase_mcp.services.database.sql.loader import SQLLoader
 from supabase_mcp.services.database.sql.models import (
@@ -11,6 +13,22 @@ from supabase_mcp.services.database.sql.models import (
 )
 
 
+class PreparedMigration(BaseModel):
+    """Validated statements that record a query as a migration."""
+
+    name: str = Field(..., description="The sanitized migration name")
+    init_validation: QueryValidationResults | None = Field(
+        None, description="Statements creating the migrations schema, if it isn't known to exist yet"
+    )
+    insert_validation: QueryValidationResults = Field(..., description="Statement inserting the migration record")
+
+    @property
+    def statements(self) -> list[ValidatedStatement]:
+        """All statements to execute, schema initialization first."""
+        init_statements = self.init_validation.statements if self.init_validation else []
+        return [*init_statements, *self.insert_validation.statements]
+
+
 class MigrationManager:
     """Responsible for preparing migration scripts without executing them."""
 
@@ -0,0 +1,197 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from pydantic import BaseModel, Field
+
+from supabase_mcp.logger import logger
+
+
+class PoolStats(BaseModel):
+    """Snapshot of the database connection pool usage."""
+
+    size: int = Field(description="Number of open connections")
+    in_use: int = Field(description="Number of connections currently acquired")
+    idle: int = Field(description="Number of open connections not in use")
+    waiters: int = Field(description="Number of operations waiting for a connection")
+    min_size: int = Field(description="Configured minimum number of connections")
+    max_size: int = Field(description="Configured maximum number of connections")
+    target_size: int = Field(description="Number of connections operations may use at the same time")
+    adaptive: bool = Field(description="Whether the target size adapts to the observed load")
+    acquires: int = Field(description="Number of connections acquired since startup")
+    acquire_p50_ms: float | None = Field(default=None, description="Median acquire wait of recent acquires")
+    acquire_p95_ms: float | None = Field(default=None, description="95th percentile acquire wait of recent acquires")
+    acquire_p99_ms: float | None = Field(default=None, description="99th percentile acquire wait of recent acquires")
+    too_many_connections: int = Field(description="Number of connections refused by the server or pooler")
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a sorted, non-empty list."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class PoolMonitor:
+    """Tracks connection pool usage and, in adaptive mode, how many connections may be used at once.
+
+    asyncpg pools can't be resized once created, so the pool is opened with the configured maximum and
+    the monitor gates acquisitions to a target size between the minimum and maximum:
+    - The target grows by one connection when the recent acquire waits exceed the wait target
+    - The target is halved whenever the server or pooler refuses a connection (too many connections)
+    - The target shrinks by one connection when recent acquires didn't wait and the pool wasn't full
+
+    Idle connections above the target are closed by the pool's inactive connection lifetime.
+    """
+
+    # Number of acquires between two adjustments of the target size
+    ADJUST_EVERY = 32
+    # Acquire waits below this many milliseconds count as not having waited at all
+    NO_WAIT_MS = 1.0
+
+    def __init__(
+        self,
+        min_size: int,
+        max_size: int,
+        adaptive: bool = False,
+        wait_target_ms: float = 50.0,
+        window: int = 512,
+    ) -> None:
+        """Initialize the pool monitor.
+
+        Args:
+            min_size: Minimum number of connections of the pool
+            max_size: Maximum number of connections of the pool
+            adaptive: Whether the target size adapts to the observed load, otherwise it stays at max_size
+            wait_target_ms: 95th percentile acquire wait above which the adaptive target grows
+            window: Number of recent acquire waits kept for the percentiles
+        """
+        self.min_size = min_size
+        self.max_size = max_size
+        self.adaptive = adaptive
+        self.wait_target_ms = wait_target_ms
+        self.target_size = min_size if adaptive else max_size
+        self.in_use = 0
+        self.acquires = 0
+        self.too_many_connections = 0
+        self._waits_ms: deque[float] = deque(maxlen=window)
+        self._peak_in_use = 0
+        self._since_adjust = 0
+        # Operations waiting for a slot, in arrival order
+        self._waiting: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def waiters(self) -> int:
+        """Number of operations waiting for a slot."""
+        return sum(1 for future in self._waiting if not future.done())
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the target size's connection slots, waiting until one is free.
+
+        Slots are released without awaiting anything, so a cancelled operation frees its slot right away.
+        """
+        if self.in_use < self.target_size and not self._waiting:
+            self._take_slot()
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._waiting.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                # The slot may have been handed over just before the cancellation
+                if future.done() and not future.cancelled():
+                    self._release_slot()
+                raise
+            finally:
+                if future in self._waiting:
+                    self._waiting.remove(future)
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    def _take_slot(self) -> None:
+        self.in_use += 1
+        self._peak_in_use = max(self._peak_in_use, self.in_use)
+
+    def _release_slot(self) -> None:
+        self.in_use -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots over to the longest waiting operations."""
+        while self._waiting and self.in_use < self.target_size:
+            future = self._waiting.popleft()
+            if not future.done():
+                self._take_slot()
+                future.set_result(None)
+
+    def record_acquire(self, wait_seconds: float) -> None:
+        """Record how long acquiring a connection took, including the wait for a slot.
+
+        Args:
+            wait_seconds: Time from requesting a connection until it was handed out
+        """
+        self.acquires += 1
+        self._waits_ms.append(wait_seconds * 1000)
+        if not self.adaptive:
+            return
+        self._since_adjust += 1
+        if self._since_adjust >= self.ADJUST_EVERY:
+            self._adjust()
+
+    def record_too_many_connections(self) -> None:
+        """Record a connection refused by the server or pooler and back off in adaptive mode."""
+        self.too_many_connections += 1
+        if self.adaptive:
+            self._set_target(max(self.min_size, self.target_size // 2), "connection refused")
+            self._reset_window()
+
+    def _adjust(self) -> None:
+        """Grow or shrink the target size based on the acquires since the last adjustment."""
+        recent = sorted(list(self._waits_ms)[-self._since_adjust :])
+        p95 = percentile(recent, 0.95)
+        if p95 > self.wait_target_ms and self.target_size < self.max_size:
+            self._set_target(self.target_size + 1, f"p95 acquire wait {p95:.1f}ms")
+        elif p95 < self.NO_WAIT_MS and self._peak_in_use < self.target_size and self.target_size > self.min_size:
+            self._set_target(self.target_size - 1, "pool underused")
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._since_adjust = 0
+        self._peak_in_use = self.in_use
+
+    def _set_target(self, target_size: int, reason: str) -> None:
+        if target_size == self.target_size:
+            return
+        logger.info(f"Adjusting connection pool target size {self.target_size} -> {target_size} ({reason})")
+        self.target_size = target_size
+        self._wake_waiters()
+
+    def stats(self, size: int = 0, idle: int = 0) -> PoolStats:
+        """Build a snapshot of the pool usage.
+
+        Args:
+            size: Number of open connections of the pool
+            idle: Number of open connections not in use
+
+        Returns:
+            PoolStats with the acquire wait percentiles of the recent acquires
+        """
+        waits = sorted(self._waits_ms)
+        return PoolStats(
+            size=size,
+            in_use=self.in_use,
+            idle=idle,
+            waiters=self.waiters,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            target_size=self.target_size,
+            adaptive=self.adaptive,
+            acquires=self.acquires,
+            acquire_p50_ms=round(percentile(waits, 0.50), 3) if waits else None,
+            acquire_p95_ms=round(percentile(waits, 0.95), 3) if waits else None,
+            acquire_p99_ms=round(percentile(waits, 0.99), 3) if waits else None,
+            too_many_connections=self.too_many_connections,
+        )
@@ -1,9 +1,19 @@
-from supabase_mcp.exceptions import OperationNotAllowedError
+from typing import Any
+
+import asyncpg
+
+from supabase_mcp.exceptions import OperationNotAllowedError, QueryError
 from supabase_mcp.logger import logger
-from supabase_mcp.services.database.migration_manager import MigrationManager
-from supabase_mcp.services.database.postgres_client import PostgresClient, QueryResult
+from supabase_mcp.services.database.catalog_cache import CatalogCache, CatalogObject
+from supabase_mcp.services.database.migration_manager import MigrationManager, PreparedMigration
+from supabase_mcp.services.database.postgres_client import (
+    PostgresClient,
+    QueryResult,
+    ResultFormat,
+    group_statement_rows,
+)
 from supabase_mcp.services.database.sql.loader import SQLLoader
-from supabase_mcp.services.database.sql.models import QueryValidationResults
+from supabase_mcp.services.database.sql.models import ParameterizedQuery, QueryValidationResults, ValidatedStatement
 from supabase_mcp.services.database.sql.validator import SQLValidator
 from supabase_mcp.services.safety.models import ClientType, SafetyMode
 from supabase_mcp.services.safety.safety_manager import SafetyManager
@@ -30,6 +40,9 @@ class QueryManager:
         sql_validator: SQLValidator | None = None,
         migration_manager: MigrationManager | None = None,
         sql_loader: SQLLoader | None = None,
+        catalog_cache: CatalogCache | None = None,
+        catalog_ttls: dict[CatalogObject, float] | None = None,
+        default_limit: int = 0,
     ):
         """
         Initialize the QueryManager.
@@ -40,12 +53,25 @@ class QueryManager:
             sql_validator: Optional SQL validator to use
             migration_manager: Optional migration manager to use
             sql_loader: Optional SQL loader to use
+            catalog_cache: Optional cache for catalog metadata results
+            catalog_ttls: Seconds each kind of catalog metadata is cached for, defaults to the cache's TTL
+            default_limit: LIMIT added to SELECT statements without one when requested, 0 disables it
         """
         self.db_client = postgres_client
         self.safety_manager = safety_manager
         self.validator = sql_validator or SQLValidator()
         self.sql_loader = sql_loader or SQLLoader()
         self.migration_manager = migration_manager or MigrationManager(loader=self.sql_loader)
+        self.default_limit = default_limit
+
+        # Projects whose migrations schema is known to exist, so init_migrations.sql isn't re-run
+        self._migration_schema_ready: set[str] = set()
+        PostgresClient.register_reset_callback(self.reset_migration_schema_state)
+
+        # Catalog metadata results, dropped when DDL touches their schema or the client is reset
+        self.catalog_cache = catalog_cache or CatalogCache()
+        self.catalog_ttls = catalog_ttls or {}
+        PostgresClient.register_reset_callback(self.catalog_cache.clear)
 
     def check_readonly(self) -> bool:
         """Returns true if current safety mode is SAFE."""
@@ -53,20 +79,38 @@ class QueryManager:
         logger.debug(f"Check readonly result: {result}")
         return result
 
-    async def handle_query(self, query: str, has_confirmation: bool = False, migration_name: str = "") -> QueryResult:
+    async def handle_query(
+        self,
+        query: str,
+        params: list[Any] | None = None,
+        has_confirmation: bool = False,
+        migration_name: str = "",
+        max_rows: int | None = None,
+        result_format: ResultFormat = ResultFormat.ROWS,
+        timeout: float | None = None,
+        apply_default_limit: bool = False,
+    ) -> QueryResult:
         """
         Handle a SQL query with validation and potential migration. Uses migration name, if provided.
 
         This method:
         1. Validates the query for safety
         2. Checks if the query requires migration
-        3. Handles migration if needed
-        4. Executes the query
+        3. Prepares the migration record if needed
+        4. Executes the query together with the migration record in one transaction
+        5. Invalidates cached catalog metadata of schemas changed by DDL
 
         Args:
             query: SQL query to execute
-            params: Query parameters
+            params: Arguments bound to the `$n` placeholders of a single-statement query
             has_confirmation: Whether the operation has been confirmed by the user
+            migration_name: Migration name to use, if provided
+            max_rows: Maximum number of rows per read statement, defaults to the configured limit.
+                Results that hit the limit are marked as truncated.
+            result_format: Shape of the rows in each statement result
+            timeout: Maximum run time of each statement in seconds, defaults to the command timeout
+            apply_default_limit: Whether to add the default LIMIT to SELECT statements without one.
+                Limited statement results report the applied limit.
 
         Returns:
             QueryResult: The result of the query execution
@@ -75,20 +119,93 @@ class QueryManager:
             OperationNotAllowedError: If the query is not allowed in the current safety mode
             ConfirmationRequiredError: If the query requires confirmation and has_confirmation is False
         """
-        # 1. Run through the validator
-        validated_query = self.validator.validate_query(query)
+        # 1. Run through the validator, parsing large queries off the event loop
+        validated_query = await self.validator.validate_query_async(query)
 
         # 2. Ensure execution is allowed
         self.safety_manager.validate_operation(ClientType.DATABASE, validated_query, has_confirmation)
         logger.debug(f"Operation with risk level {validated_query.highest_risk_level} validated successfully")
 
-        # 3. Handle migration if needed
-        await self.handle_migration(validated_query, query, migration_name)
+        # 3. Prepare the migration record, if needed, to be written in the query's transaction
+        migration = self.prepare_migration(validated_query, query, migration_name)
+
+        # Guard exploratory SELECTs against reading whole tables
+        if apply_default_limit:
+            validated_query = self.validator.apply_row_limit(validated_query, self.default_limit)
 
         # 4. Execute the query
-        return await self.handle_query_execution(validated_query)
+        result = await self.handle_query_execution(
+            validated_query,
+            params=params,
+            max_rows=max_rows,
+            result_format=result_format,
+            migration_statements=migration.statements if migration else None,
+            timeout=timeout,
+        )
+
+        # 5. Drop cached catalog metadata the query may have changed
+        self.catalog_cache.invalidate_for(validated_query)
+        self.report_applied_limits(validated_query, result)
+
+        # 6. Track the outcome of the migration record
+        if migration:
+            await self.handle_migration_result(result, migration)
+        return result
 
-    async def handle_query_execution(self, validated_query: QueryValidationResults) -> QueryResult:
+    def report_applied_limits(self, validated_query: QueryValidationResults, result: QueryResult) -> None:
+        """Mark the results of statements that got the default LIMIT with the applied limit."""
+        executed = [statement for statement in validated_query.statements if statement.query]
+        if len(executed) != len(result.results):
+            return
+        for statement, statement_result in zip(executed, result.results, strict=True):
+            if statement.limit_applied is not None:
+                statement_result.limit_applied = statement.limit_applied
+
+    async def handle_catalog_query(
+        self,
+        kind: CatalogObject,
+        query: str,
+        params: list[Any] | None = None,
+        schema_name: str | None = None,
+        table: str | None = None,
+        result_format: ResultFormat = ResultFormat.ROWS,
+        group_by: str | None = None,
+    ) -> QueryResult:
+        """
+        Handle a catalog metadata query, serving it from the catalog cache while the cached result is fresh.
+
+        Args:
+            kind: Kind of catalog object the query describes
+            query: SQL query to execute
+            params: Arguments bound to the `$n` placeholders of the query
+            schema_name: Schema of the object, if any
+            table: Table of the object, if any
+            result_format: Shape of the rows in each statement result
+            group_by: Column to group the rows by, each group's rows are listed under `columns`
+
+        Returns:
+            QueryResult: The result of the query, with its age set if it came from the cache
+        """
+        cached = self.catalog_cache.get(kind, schema_name, table, result_format)
+        if cached is not None:
+            logger.debug(f"Serving {kind.value} metadata from the catalog cache ({cached.cache_age_seconds}s old)")
+            return cached
+
+        result = await self.handle_query(query, params=params, result_format=result_format)
+        if group_by:
+            result.results = [group_statement_rows(statement, group_by, "columns") for statement in result.results]
+        self.catalog_cache.put(result, kind, schema_name, table, result_format, ttl=self.catalog_ttls.get(kind))
+        return result
+
+    async def handle_query_execution(
+        self,
+        validated_query: QueryValidationResults,
+        params: list[Any] | None = None,
+        max_rows: int | None = None,
+        result_format: ResultFormat = ResultFormat.ROWS,
+        migration_statements: list[ValidatedStatement] | None = None,
+        timeout: float | None = None,
+    ) -> QueryResult:
         """
         Handle query execution with validation and potential migration.
 
@@ -99,52 +216,118 @@ class QueryManager:
 
         Args:
             validated_query: The validation result
-            query: The original query
+            params: Arguments bound to the `$n` placeholders of a single-statement query
+            max_rows: Maximum number of rows per read statement, defaults to the configured limit
+            result_format: Shape of the rows in each statement result
+            migration_statements: Statements recording the query as a migration in the same transaction
+            timeout: Maximum run time of each statement in seconds
 
         Returns:
             QueryResult: The result of the query execution
         """
         readonly = self.check_readonly()
-        result = await self.db_client.execute_query(validated_query, readonly)
+        result = await self.db_client.execute_query(
+            validated_query,
+            readonly,
+            params=params,
+            max_rows=max_rows,
+            result_format=result_format,
+            migration_statements=migration_statements,
+            timeout=timeout,
+        )
+        if any(statement_result.truncated for statement_result in result.results):
+            logger.warning("Query result was truncated after reaching the configured row or size limit")
         logger.debug(f"Query result: {result}")
         return result
 
-    async def handle_migration(
+    def prepare_migration(
         self, validation_result: QueryValidationResults, original_query: str, migration_name: str = ""
-    ) -> None:
+    ) -> PreparedMigration | None:
         """
-        Handle migration for a query that requires it.
+        Prepare the statements recording a query as a migration, to run in the query's own transaction.
+
+        The migrations schema initialization is included until the schema is known to exist.
 
         Args:
             validation_result: The validation result
-            query: The original query
+            original_query: The original query
             migration_name: Migration name to use, if provided
+
+        Returns:
+            The prepared migration, or None if no migration is needed or it couldn't be prepared
         """
-        # 1. Check if migration is needed
         if not validation_result.needs_migration():
             logger.debug("No migration needed for this query")
-            return
-
-        # 2. Prepare migration query
-        migration_query, name = self.migration_manager.prepare_migration_query(
-            validation_result, original_query, migration_name
-        )
-        logger.debug("Migration query prepared")
+            return None
 
-        # 3. Execute migration query
         try:
-            # First, ensure the migration schema exists
-            await self.init_migration_schema()
+            migration_query, name = self.migration_manager.prepare_migration_query(
+                validation_result, original_query, migration_name
+            )
+            init_validation = None
+            if self.db_client.project_ref not in self._migration_schema_ready:
+                init_validation = self.validator.validate_query(self.sql_loader.get_init_migrations_query())
+            migration = PreparedMigration(
+                name=name,
+                init_validation=init_validation,
+                insert_validation=self.validator.validate_query(migration_query),
+            )
+            logger.debug("Migration statements prepared")
+            return migration
+        except Exception as e:
+            # We don't want to fail the main query if the migration can't be prepared
+            logger.warning(f"Failed to prepare migration: {e}")
+            return None
+
+    async def handle_migration_result(self, result: QueryResult, migration: PreparedMigration) -> None:
+        """
+        Track the outcome of a migration recorded in the query's transaction.
 
-            # Then execute the migration query
-            migration_validation = self.validator.validate_query(migration_query)
-            await self.db_client.execute_query(migration_validation, readonly=False)
-            logger.info(f"Migration '{name}' executed successfully")
+        If the record couldn't be written, the query has still been committed, so the migration is recorded
+        separately, see record_migration.
+
+        Args:
+            result: The result of the query execution
+            migration: The migration that was recorded with the query
+        """
+        if result.migration_recorded:
+            self._migration_schema_ready.add(self.db_client.project_ref)
+            logger.info(f"Migration '{migration.name}' recorded successfully")
+            return
+
+        logger.info(f"Migration '{migration.name}' wasn't recorded in the query transaction, recording it separately")
+        try:
+            await self.record_migration(migration)
+            logger.info(f"Migration '{migration.name}' executed successfully")
         except Exception as e:
             logger.debug(f"Migration failure details: {str(e)}")
             # We don't want to fail the main query if migration fails
             # Just log the error and continue
-            logger.warning(f"Failed to record migration '{name}': {e}")
+            logger.warning(f"Failed to record migration '{migration.name}': {e}")
+
+    async def record_migration(self, migration: PreparedMigration) -> None:
+        """
+        Record a migration on its own, initializing the migrations schema unless it is known to exist.
+
+        If the migrations table turns out to be missing (e.g. it was dropped after the schema was marked as
+        ready), the schema is re-initialized and the insert is tried once more.
+
+        Args:
+            migration: The migration to record
+
+        Raises:
+            QueryError: If the migration couldn't be recorded
+        """
+        await self.ensure_migration_schema()
+        try:
+            await self.db_client.execute_query(migration.insert_validation, readonly=False)
+        except QueryError as e:
+            if not self.is_missing_migration_schema_error(e):
+                raise
+            logger.info("Migrations table is missing, re-initializing the migrations schema")
+            self.reset_migration_schema_state()
+            await self.ensure_migration_schema()
+            await self.db_client.execute_query(migration.insert_validation, readonly=False)
 
     async def init_migration_schema(self) -> None:
         """Initialize the migrations schema and table if they don't exist."""
@@ -155,10 +338,30 @@ class QueryManager:
             # Validate and execute it
             init_validation = self.validator.validate_query(init_query)
             await self.db_client.execute_query(init_validation, readonly=False)
+            self._migration_schema_ready.add(self.db_client.project_ref)
             logger.debug("Migrations schema initialized successfully")
         except Exception as e:
             logger.warning(f"Failed to initialize migrations schema: {e}")
 
+    async def ensure_migration_schema(self) -> None:
+        """Initialize the migrations schema once per project, skipping the round trip once it is ready."""
+        if self.db_client.project_ref in self._migration_schema_ready:
+            logger.debug("Migrations schema already initialized, skipping")
+            return
+        await self.init_migration_schema()
+
+    def reset_migration_schema_state(self) -> None:
+        """Forget which projects have an initialized migrations schema, forcing a re-check on next use."""
+        self._migration_schema_ready.clear()
+
+    @staticmethod
+    def is_missing_migration_schema_error(error: Exception) -> bool:
+        """Check whether a query error was caused by a missing migrations schema or table."""
+        return isinstance(
+            error.__cause__,
+            asyncpg.exceptions.UndefinedTableError | asyncpg.exceptions.InvalidSchemaNameError,
+        )
+
     async def handle_confirmation(self, confirmation_id: str) -> QueryResult:
         """
         Handle a confirmed operation using its confirmation ID.
@@ -187,18 +390,22 @@ class QueryManager:
         """Get a query to list all schemas."""
         return self.sql_loader.get_schemas_query()
 
-    def get_tables_query(self, schema_name: str) -> str:
-        """Get a query to list all tables in a schema."""
-        return self.sql_loader.get_tables_query(schema_name)
+    def get_tables_query(self, schema_name: str, fast: bool = False) -> ParameterizedQuery:
+        """Get a parameterized query to list all tables in a schema, with estimated sizes if fast is set."""
+        return self.sql_loader.get_tables_query(schema_name, fast=fast)
 
-    def get_table_schema_query(self, schema_name: str, table: str) -> str:
-        """Get a query to get the schema of a table."""
+    def get_table_schema_query(self, schema_name: str, table: str) -> ParameterizedQuery:
+        """Get a parameterized query to get the schema of a table."""
         return self.sql_loader.get_table_schema_query(schema_name, table)
 
+    def get_table_schemas_query(self, schema_name: str, tables: list[str] | None = None) -> ParameterizedQuery:
+        """Get a parameterized query describing the columns of several tables, or of all tables if none are given."""
+        return self.sql_loader.get_table_schemas_query(schema_name, tables)
+
     def get_migrations_query(
         self, limit: int = 50, offset: int = 0, name_pattern: str = "", include_full_queries: bool = False
-    ) -> str:
-        """Get a query to list migrations."""
+    ) -> ParameterizedQuery:
+        """Get a parameterized query to list migrations."""
         return self.sql_loader.get_migrations_query(
             limit=limit, offset=offset, name_pattern=name_pattern, include_full_queries=include_full_queries
         )
@@ -1,14 +1,102 @@
+import re
+import threading
 from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
 
 from supabase_mcp.logger import logger
+from supabase_mcp.services.database.sql.models import ParameterizedQuery
+
+# Matches `{name}` placeholders in SQL templates
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+class SQLTemplate(BaseModel):
+    """A SQL file split once into literal text and `{name}` placeholders, so rendering never re-scans it."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    sql: str
+    # Alternating literal text and placeholder names, always starting and ending with literal text
+    segments: tuple[str, ...]
+
+    @classmethod
+    def parse(cls, name: str, sql: str) -> "SQLTemplate":
+        """Split the SQL text of a template into its segments."""
+        return cls(name=name, sql=sql, segments=tuple(PLACEHOLDER_PATTERN.split(sql)))
+
+    @property
+    def placeholders(self) -> tuple[str, ...]:
+        """Placeholder names in order of appearance, including repeats."""
+        return self.segments[1::2]
+
+    def render(self, **values: Any) -> str:
+        """
+        Substitute the placeholders with the text of their values.
+
+        Placeholders without a value are left in place. Values are inserted as-is and never scanned
+        for placeholders themselves.
+
+        Args:
+            **values: Values for the placeholders
+
+        Returns:
+            str: The rendered SQL
+        """
+        parts = list(self.segments)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = str(values[name]) if name in values else f"{{{name}}}"
+        return "".join(parts)
+
+    def render_parameterized(self, **values: Any) -> ParameterizedQuery:
+        """
+        Turn the placeholders into `$n` bind parameters.
+
+        Each distinct placeholder gets one parameter number, in order of first appearance, so the
+        resulting query text only depends on the template and can be cached by the server and the validator.
+
+        Args:
+            **values: Values bound to the placeholders
+
+        Returns:
+            ParameterizedQuery: The query text and the arguments to execute it with
+
+        Raises:
+            ValueError: If the template uses a placeholder without a value
+        """
+        positions: dict[str, int] = {}
+        params: list[Any] = []
+        parts = list(self.segments)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if name not in positions:
+                if name not in values:
+                    raise ValueError(f"Missing value for SQL template placeholder: {name}")
+                params.append(values[name])
+                positions[name] = len(params)
+            parts[i] = f"${positions[name]}"
+        return ParameterizedQuery(query="".join(parts), params=params)
 
 
 class SQLLoader:
-    """Responsible for loading SQL queries from files."""
+    """Responsible for loading SQL queries from files.
+
+    Files are read once and kept in a process-wide template registry, so building a query never touches the disk
+    after the first use (or at all, once `preload` has run at startup).
+    """
 
     # Path to SQL files directory
     SQL_DIR = Path(__file__).parent / "queries"
 
+    # Template registry, keyed by file path relative to SQL_DIR
+    _templates: dict[str, SQLTemplate] = {}
+    _templates_lock = threading.Lock()
+    _disk_reads = 0
+    _registry_hits = 0
+
     @classmethod
     def load_sql(cls, filename: str) -> str:
         """
@@ -20,6 +108,22 @@ class SQLLoader:
         Returns:
             str: The SQL query from the file
 
+        Raises:
+            FileNotFoundError: If the SQL file doesn't exist
+        """
+        return cls.get_template(filename).sql
+
+    @classmethod
+    def get_template(cls, filename: str) -> SQLTemplate:
+        """
+        Get a SQL template from the registry, reading its file on first use.
+
+        Args:
+            filename: Name of the SQL file (with or without .sql extension)
+
+        Returns:
+            SQLTemplate: The parsed template
+
         Raises:
             FileNotFoundError: If the SQL file doesn't exist
         """
@@ -27,6 +131,20 @@ class SQLLoader:
         if not filename.endswith(".sql"):
             filename = f"{filename}.sql"
 
+        with cls._templates_lock:
+            template = cls._templates.get(filename)
+            if template is not None:
+                cls._registry_hits += 1
+                return template
+
+        template = cls._read_template(filename)
+        with cls._templates_lock:
+            cls._disk_reads += 1
+            return cls._templates.setdefault(filename, template)
+
+    @classmethod
+    def _read_template(cls, filename: str) -> SQLTemplate:
+        """Read and parse a SQL file."""
         file_path = cls.SQL_DIR / filename
 
         if not file_path.exists():
@@ -36,7 +154,57 @@ class SQLLoader:
         with open(file_path) as f:
             sql = f.read().strip()
             logger.debug(f"Loaded SQL file: {filename} ({len(sql)} chars)")
-            return sql
+            return SQLTemplate.parse(filename, sql)
+
+    @classmethod
+    def preload(cls) -> int:
+        """
+        Read every SQL file under SQL_DIR into the template registry.
+
+        Returns:
+            int: Number of templates in the registry
+        """
+        for file_path in sorted(cls.SQL_DIR.rglob("*.sql")):
+            cls.get_template(file_path.relative_to(cls.SQL_DIR).as_posix())
+        stats = cls.template_stats()
+        logger.debug(f"Preloaded {stats['templates']} SQL templates ({stats['bytes']} chars)")
+        return stats["templates"]
+
+    @classmethod
+    def template_stats(cls) -> dict[str, int]:
+        """Return statistics about the template registry."""
+        with cls._templates_lock:
+            return {
+                "templates": len(cls._templates),
+                "bytes": sum(len(template.sql) for template in cls._templates.values()),
+                "disk_reads": cls._disk_reads,
+                "hits": cls._registry_hits,
+            }
+
+    @classmethod
+    def clear_templates(cls) -> None:
+        """Empty the template registry and reset its statistics."""
+        with cls._templates_lock:
+            cls._templates.clear()
+            cls._disk_reads = 0
+            cls._registry_hits = 0
+
+    @classmethod
+    def render_parameterized(cls, sql: str, **values: Any) -> ParameterizedQuery:
+        """
+        Turn the `{name}` placeholders of ad-hoc SQL text into `$n` bind parameters.
+
+        Args:
+            sql: SQL template with `{name}` placeholders
+            **values: Values bound to the placeholders
+
+        Returns:
+            ParameterizedQuery: The query text and the arguments to execute it with
+
+        Raises:
+            ValueError: If the template uses a placeholder without a value
+        """
+        return SQLTemplate.parse("<inline>", sql).render_parameterized(**values)
 
     @classmethod
     def get_schemas_query(cls) -> str:
@@ -44,28 +212,37 @@ class SQLLoader:
         return cls.load_sql("get_schemas")
 
     @classmethod
-    def get_tables_query(cls, schema_name: str) -> str:
-        """Get a query to list all tables in a schema."""
-        query = cls.load_sql("get_tables")
-        return query.replace("{schema_name}", schema_name)
+    def get_tables_query(cls, schema_name: str, fast: bool = False) -> ParameterizedQuery:
+        """Get a parameterized query to list all tables in a schema.
+
+        Args:
+            schema_name: Schema to list the tables of
+            fast: Report sizes and row counts from planner estimates instead of measuring them
+        """
+        return cls.get_template("get_tables").render_parameterized(schema_name=schema_name, estimate=fast)
+
+    @classmethod
+    def get_table_schema_query(cls, schema_name: str, table: str) -> ParameterizedQuery:
+        """Get a parameterized query to get the schema of a table."""
+        return cls.get_template("get_table_schema").render_parameterized(schema_name=schema_name, table=table)
 
     @classmethod
-    def get_table_schema_query(cls, schema_name: str, table: str) -> str:
-        """Get a query to get the schema of a table."""
-        query = cls.load_sql("get_table_schema")
-        return query.replace("{schema_name}", schema_name).replace("{table}", table)
+    def get_table_schemas_query(cls, schema_name: str, tables: list[str] | None = None) -> ParameterizedQuery:
+        """Get a parameterized query describing the columns of several tables, or of all tables if none are given."""
+        return cls.get_template("get_table_schemas").render_parameterized(
+            schema_name=schema_name, tables=tables or None
+        )
 
     @classmethod
     def get_migrations_query(
         cls, limit: int = 50, offset: int = 0, name_pattern: str = "", include_full_queries: bool = False
-    ) -> str:
-        """Get a query to list migrations."""
-        query = cls.load_sql("get_migrations")
-        return (
-            query.replace("{limit}", str(limit))
-            .replace("{offset}", str(offset))
-            .replace("{name_pattern}", name_pattern)
-            .replace("{include_full_queries}", str(include_full_queries).lower())
+    ) -> ParameterizedQuery:
+        """Get a parameterized query to list migrations."""
+        return cls.get_template("get_migrations").render_parameterized(
+            limit=limit,
+            offset=offset,
+            name_pattern=name_pattern,
+            include_full_queries=include_full_queries,
         )
 
     @classmethod
@@ -85,8 +262,7 @@ class SQLLoader:
         Returns:
             str: The SQL query to create a migration
         """
-        query = cls.load_sql("create_migration")
-        return query.replace("{version}", version).replace("{name}", name).replace("{statements}", statements)
+        return cls.get_template("create_migration").render(version=version, name=name, statements=statements)
 
     @classmethod
     def get_logs_query(cls, collection: str, where_clause: str = "", limit: int = 20) -> str:
@@ -123,10 +299,10 @@ class SQLLoader:
             raise ValueError(f"Unknown log collection: {collection}")
 
         # Load the SQL template
-        query = cls.load_sql(sql_file)
+        template = cls.get_template(sql_file)
 
         # Handle special case for cron logs
         if collection == "cron":
-            return query.replace("{and_where_clause}", where_clause).replace("{limit}", str(limit))
+            return template.render(and_where_clause=where_clause, limit=limit)
         else:
-            return query.replace("{where_clause}", where_clause).replace("{limit}", str(limit))
+            return template.render(where_clause=where_clause, limit=limit)
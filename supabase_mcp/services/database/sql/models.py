@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -82,6 +83,12 @@ class ValidatedStatement(BaseModel):
         ..., description="Whether this statement requires a migration based on statement type and safety rules"
     )
     query: str | None = Field(None, description="The actual SQL text for this statement extracted from original query")
+    returns_rows: bool = Field(
+        True, description="Whether executing the statement can return rows (queries, RETURNING clauses, etc.)"
+    )
+    limit_applied: int | None = Field(
+        default=None, description="Row limit added to the statement's query because it had no LIMIT of its own"
+    )
 
 
 class QueryValidationResults(BaseModel):
@@ -101,3 +108,10 @@ class QueryValidationResults(BaseModel):
     def needs_migration(self) -> bool:
         """Check if any statement in the batch needs migration."""
         return any(stmt.needs_migration for stmt in self.statements)
+
+
+class ParameterizedQuery(BaseModel):
+    """SQL query with `$n` placeholders and the arguments bound to them."""
+
+    query: str = Field(..., description="The SQL text with `$1`, `$2`, ... placeholders, constant for a given template")
+    params: list[Any] = Field(default_factory=list, description="Arguments bound to the placeholders, in order")
@@ -2,7 +2,7 @@ SELECT
     version,
     name,
     CASE
-        WHEN '{include_full_queries}' = 'true' THEN statements
+        WHEN {include_full_queries}::boolean THEN statements
         ELSE NULL
     END AS statements,
     array_length(statements, 1) AS statement_count,
@@ -13,8 +13,8 @@ SELECT
 FROM supabase_migrations.schema_migrations
 WHERE
     -- Filter by name if provided
-    ('{name_pattern}' = '' OR name ILIKE '%' || '{name_pattern}' || '%')
+    ({name_pattern}::text = '' OR name ILIKE '%' || {name_pattern} || '%')
 ORDER BY
     -- Order by version (timestamp) descending
     version DESC
-LIMIT {limit} OFFSET {offset};
+LIMIT {limit}::integer OFFSET {offset}::integer;
@@ -4,8 +4,8 @@ WITH pk AS (
     INNER JOIN information_schema.constraint_column_usage AS ccu
         ON tc.constraint_name = ccu.constraint_name
     WHERE
-        tc.table_schema = '{schema_name}'
-        AND tc.table_name = '{table}'
+        tc.table_schema = {schema_name}
+        AND tc.table_name = {table}
         AND tc.constraint_type = 'PRIMARY KEY'
 ),
 
@@ -20,8 +20,8 @@ fk AS (
     INNER JOIN information_schema.constraint_column_usage AS ccu
         ON tc.constraint_name = ccu.constraint_name
     WHERE
-        tc.table_schema = '{schema_name}'
-        AND tc.table_name = '{table}'
+        tc.table_schema = {schema_name}
+        AND tc.table_name = {table}
         AND tc.constraint_type = 'FOREIGN KEY'
 )
 
@@ -38,14 +38,14 @@ SELECT DISTINCT
 FROM information_schema.columns AS c
 INNER JOIN pg_class AS pc
     ON
-        pc.relname = '{table}'
+        pc.relname = {table}
         AND pc.relnamespace = (
             SELECT oid FROM pg_namespace
-            WHERE nspname = '{schema_name}'
+            WHERE nspname = {schema_name}
         )
 LEFT JOIN pk ON c.column_name = pk.column_name
 LEFT JOIN fk ON c.column_name = fk.column_name
 WHERE
-    c.table_schema = '{schema_name}'
-    AND c.table_name = '{table}'
+    c.table_schema = {schema_name}
+    AND c.table_name = {table}
 ORDER BY c.ordinal_position;
@@ -0,0 +1,104 @@
+-- Columns, primary keys and foreign key references of several tables of a schema, read from pg_catalog
+-- in one pass. When no table names are given, every table, view and foreign table of the schema is described.
+WITH rels AS (
+    SELECT
+        c.oid,
+        c.relname
+    FROM pg_catalog.pg_class AS c
+    INNER JOIN pg_catalog.pg_namespace AS n
+        ON c.relnamespace = n.oid
+    WHERE
+        n.nspname = {schema_name}
+        AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+        AND ({tables}::text[] IS NULL OR c.relname = ANY({tables}::text[]))
+        -- Same visibility rules as information_schema.tables
+        AND (
+            pg_has_role(c.relowner, 'USAGE')
+            OR has_table_privilege(c.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER')
+            OR has_any_column_privilege(c.oid, 'SELECT, INSERT, UPDATE, REFERENCES')
+        )
+),
+
+pk AS (
+    SELECT
+        con.conrelid,
+        key.attnum
+    FROM pg_catalog.pg_constraint AS con
+    INNER JOIN rels
+        ON con.conrelid = rels.oid
+    CROSS JOIN LATERAL unnest(con.conkey) AS key (attnum)
+    WHERE con.contype = 'p'
+),
+
+fk AS (
+    -- A column can be part of several foreign keys, report the first one by name
+    SELECT DISTINCT ON (con.conrelid, key.attnum)
+        con.conrelid,
+        key.attnum,
+        ref_ns.nspname AS foreign_table_schema,
+        ref.relname AS foreign_table_name,
+        ref_att.attname AS foreign_column_name
+    FROM pg_catalog.pg_constraint AS con
+    INNER JOIN rels
+        ON con.conrelid = rels.oid
+    CROSS JOIN LATERAL unnest(con.conkey, con.confkey) AS key (attnum, ref_attnum)
+    INNER JOIN pg_catalog.pg_class AS ref
+        ON con.confrelid = ref.oid
+    INNER JOIN pg_catalog.pg_namespace AS ref_ns
+        ON ref.relnamespace = ref_ns.oid
+    INNER JOIN pg_catalog.pg_attribute AS ref_att
+        ON
+            con.confrelid = ref_att.attrelid
+            AND key.ref_attnum = ref_att.attnum
+    WHERE con.contype = 'f'
+    ORDER BY con.conrelid, key.attnum, con.conname
+)
+
+SELECT
+    r.relname AS table_name,
+    a.attname AS column_name,
+    -- Same type names as information_schema.columns.data_type, which get_table_schema returns
+    CASE
+        WHEN coalesce(bt.typelem, t.typelem) <> 0 AND coalesce(bt.typlen, t.typlen) = -1 THEN 'ARRAY'
+        WHEN coalesce(bt_ns.nspname, t_ns.nspname) = 'pg_catalog'
+            THEN format_type(coalesce(bt.oid, t.oid), NULL)
+        ELSE 'USER-DEFINED'
+    END AS data_type,
+    CASE WHEN a.attnotnull OR (t.typtype = 'd' AND t.typnotnull) THEN 'NO' ELSE 'YES' END AS is_nullable,
+    pg_get_expr(ad.adbin, ad.adrelid) AS column_default,
+    a.attnum AS ordinal_position,
+    fk.foreign_table_schema,
+    fk.foreign_table_name,
+    fk.foreign_column_name,
+    col_description(r.oid, a.attnum) AS column_description,
+    pk.attnum IS NOT NULL AS is_primary_key
+FROM rels AS r
+INNER JOIN pg_catalog.pg_attribute AS a
+    ON
+        r.oid = a.attrelid
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+INNER JOIN pg_catalog.pg_type AS t
+    ON a.atttypid = t.oid
+INNER JOIN pg_catalog.pg_namespace AS t_ns
+    ON t.typnamespace = t_ns.oid
+-- Domains are described by their base type
+LEFT JOIN pg_catalog.pg_type AS bt
+    ON
+        t.typtype = 'd'
+        AND t.typbasetype = bt.oid
+LEFT JOIN pg_catalog.pg_namespace AS bt_ns
+    ON bt.typnamespace = bt_ns.oid
+LEFT JOIN pg_catalog.pg_attrdef AS ad
+    ON
+        a.attrelid = ad.adrelid
+        AND a.attnum = ad.adnum
+LEFT JOIN pk
+    ON
+        r.oid = pk.conrelid
+        AND a.attnum = pk.attnum
+LEFT JOIN fk
+    ON
+        r.oid = fk.conrelid
+        AND a.attnum = fk.attnum
+ORDER BY r.relname, a.attnum;
@@ -1,56 +1,75 @@
-(
--- Regular tables & views: full metadata available
+-- Tables, views and foreign tables of a schema, read from pg_catalog in one pass.
+-- Column and index counts are aggregated once per schema instead of per table.
+-- In estimate mode, sizes and row counts come from the planner statistics (relpages/reltuples)
+-- instead of pg_total_relation_size and the live tuple counters, which touch every table's storage.
+WITH rels AS (
     SELECT
-        t.table_name,
-        t.table_type,
-        obj_description(pc.oid) AS description,
-        pg_total_relation_size(format('%I.%I', t.table_schema, t.table_name))::bigint AS size_bytes,
-        pg_stat_get_live_tuples(pc.oid)::bigint AS row_count,
-        (
-            SELECT count(*) FROM information_schema.columns AS c
-            WHERE
-                c.table_schema = t.table_schema
-                AND c.table_name = t.table_name
-        ) AS column_count,
-        (
-            SELECT count(*) FROM pg_indexes AS i
-            WHERE
-                i.schemaname = t.table_schema
-                AND i.tablename = t.table_name
-        ) AS index_count
-    FROM information_schema.tables AS t
-    INNER JOIN pg_class AS pc
-        ON
-            t.table_name = pc.relname
-            AND pc.relnamespace = (
-                SELECT oid FROM pg_namespace
-                WHERE nspname = '{schema_name}'
-            )
+        c.oid,
+        c.relname,
+        c.relkind,
+        c.relpages,
+        c.reltuples
+    FROM pg_catalog.pg_class AS c
+    INNER JOIN pg_catalog.pg_namespace AS n
+        ON c.relnamespace = n.oid
     WHERE
-        t.table_schema = '{schema_name}'
-        AND t.table_type IN ('BASE TABLE', 'VIEW')
-)
-UNION ALL
-(
--- Foreign tables: limited metadata (size & row count functions don't apply)
+        n.nspname = {schema_name}
+        AND c.relkind IN ('r', 'p', 'v', 'f')
+        -- Same visibility rules as information_schema.tables
+        AND (
+            pg_has_role(c.relowner, 'USAGE')
+            OR has_table_privilege(c.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER')
+            OR has_any_column_privilege(c.oid, 'SELECT, INSERT, UPDATE, REFERENCES')
+        )
+),
+
+cols AS (
+    SELECT
+        a.attrelid,
+        count(*) AS column_count
+    FROM pg_catalog.pg_attribute AS a
+    INNER JOIN rels
+        ON a.attrelid = rels.oid
+    WHERE
+        a.attnum > 0
+        AND NOT a.attisdropped
+    GROUP BY a.attrelid
+),
+
+idx AS (
     SELECT
-        ft.foreign_table_name AS table_name,
-        'FOREIGN TABLE' AS table_type,
-        (
-            SELECT obj_description(
-                (quote_ident(ft.foreign_table_schema) || '.' || quote_ident(ft.foreign_table_name))::regclass
-            )
-        ) AS description,
-        0::bigint AS size_bytes,
-        NULL::bigint AS row_count,
-        (
-            SELECT count(*) FROM information_schema.columns AS c
-            WHERE
-                c.table_schema = ft.foreign_table_schema
-                AND c.table_name = ft.foreign_table_name
-        ) AS column_count,
-        0 AS index_count
-    FROM information_schema.foreign_tables AS ft
-    WHERE ft.foreign_table_schema = '{schema_name}'
+        i.indrelid,
+        count(*) AS index_count
+    FROM pg_catalog.pg_index AS i
+    INNER JOIN rels
+        ON i.indrelid = rels.oid
+    GROUP BY i.indrelid
 )
+
+SELECT
+    r.relname AS table_name,
+    CASE r.relkind
+        WHEN 'v' THEN 'VIEW'
+        WHEN 'f' THEN 'FOREIGN TABLE'
+        ELSE 'BASE TABLE'
+    END AS table_type,
+    obj_description(r.oid, 'pg_class') AS description,
+    CASE
+        WHEN r.relkind NOT IN ('r', 'p') THEN 0
+        WHEN {estimate}::boolean THEN r.relpages::bigint * current_setting('block_size')::bigint
+        ELSE pg_total_relation_size(r.oid)
+    END::bigint AS size_bytes,
+    CASE
+        WHEN r.relkind = 'f' THEN NULL
+        -- reltuples is -1 until the table has been vacuumed or analyzed
+        WHEN {estimate}::boolean THEN nullif(r.reltuples, -1)::bigint
+        ELSE pg_stat_get_live_tuples(r.oid)
+    END::bigint AS row_count,
+    coalesce(cols.column_count, 0) AS column_count,
+    coalesce(idx.index_count, 0) AS index_count
+FROM rels AS r
+LEFT JOIN cols
+    ON r.oid = cols.attrelid
+LEFT JOIN idx
+    ON r.oid = idx.indrelid
 ORDER BY size_bytes DESC;
@@ -1,6 +1,13 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from pglast import ast
+from pglast.enums.nodes import LimitOption
 from pglast.parser import ParseError, parse_sql
+from pglast.stream import RawStream
 
 from supabase_mcp.exceptions import ValidationError
 from supabase_mcp.logger import logger
@@ -39,8 +46,76 @@ class SQLValidator:
         "CreateProcStmt": "procedure",  # For CREATE PROCEDURE
     }
 
-    def __init__(self, safety_config: SQLSafetyConfig | None = None) -> None:
+    def __init__(
+        self,
+        safety_config: SQLSafetyConfig | None = None,
+        cache_size: int = 256,
+        offload_threshold: int = 20_000,
+        max_workers: int = 2,
+    ) -> None:
+        """Initialize the validator.
+
+        Args:
+            safety_config: Safety configuration used to classify statements
+            cache_size: Maximum number of validation results kept in the LRU cache, 0 disables caching
+            offload_threshold: Query length in characters from which validate_query_async parses in a worker thread
+            max_workers: Number of worker threads used for parsing large queries
+        """
         self.safety_config = safety_config or SQLSafetyConfig()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: OrderedDict[str, QueryValidationResults] = OrderedDict()
+        # Guards the cache, which is also used from the parser worker threads
+        self._cache_lock = threading.Lock()
+        self.offload_threshold = offload_threshold
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the validation cache statistics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+        }
+
+    def clear_cache(self) -> None:
+        """Remove all cached validation results and reset the counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def _get_cached(self, sql_query: str) -> QueryValidationResults | None:
+        """Look up a validation result in the LRU cache, updating the hit/miss counters."""
+        if not self.cache_size:
+            return None
+        with self._cache_lock:
+            result = self._cache.get(sql_query)
+            if result is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(sql_query)
+            self.cache_hits += 1
+            return result
+
+    def _store_cached(self, sql_query: str, result: QueryValidationResults) -> None:
+        """Store a validation result in the LRU cache, evicting the least recently used entry if full."""
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._cache[sql_query] = result
+            self._cache.move_to_end(sql_query)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def shutdown(self) -> None:
+        """Shut down the parser worker threads, if they were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def validate_schema_name(self, schema_name: str) -> str:
         """Validate schema name.
@@ -97,6 +172,9 @@ class SQLValidator:
         """
         Identify the type of SQL query using PostgreSQL's parser.
 
+        Results are cached by the exact query text, since statement offsets refer to it. Cached results
+        are shared between callers and must not be modified.
+
         Args:
             sql_query: A SQL query string to parse
 
@@ -105,6 +183,16 @@ class SQLValidator:
         Raises:
             ValidationError: If the query is not valid or contains TCL statements
         """
+        # Return the cached result if this exact query was validated before
+        cached_result = self._get_cached(sql_query)
+        if cached_result is not None:
+            logger.debug("Using cached validation result")
+            return cached_result
+
+        return self._validate_uncached(sql_query)
+
+    def _validate_uncached(self, sql_query: str) -> QueryValidationResults:
+        """Parse and validate a query that isn't in the cache, then cache its result."""
         try:
             # Validate raw input
             sql_query = self.basic_query_validation(sql_query)
@@ -127,6 +215,7 @@ class SQLValidator:
                         "Queries will be automatically wrapped in transactions by the system."
                     )
 
+            self._store_cached(sql_query, result)
             return result
         except ParseError as e:
             logger.exception(f"SQL syntax error: {str(e)}")
@@ -138,6 +227,87 @@ class SQLValidator:
             logger.exception(f"Unexpected error during SQL validation: {str(e)}")
             raise ValidationError(f"Unexpected error during SQL validation: {str(e)}") from e
 
+    async def validate_query_async(self, sql_query: str) -> QueryValidationResults:
+        """Validate a SQL query without blocking the event loop on large inputs.
+
+        Queries shorter than the offload threshold, and queries already in the cache, are validated
+        inline. Larger queries are parsed in a worker thread so other requests keep being served.
+
+        Args:
+            sql_query: A SQL query string to parse
+
+        Returns:
+            QueryValidationResults: A validation result object containing information about the SQL statements
+        Raises:
+            ValidationError: If the query is not valid or contains TCL statements
+        """
+        if len(sql_query) < self.offload_threshold:
+            return self.validate_query(sql_query)
+
+        cached_result = self._get_cached(sql_query)
+        if cached_result is not None:
+            logger.debug("Using cached validation result")
+            return cached_result
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sql-validator")
+
+        logger.debug(f"Offloading validation of a {len(sql_query)} character query to a worker thread")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._validate_uncached, sql_query)
+
+    def apply_row_limit(self, validated_query: QueryValidationResults, limit: int) -> QueryValidationResults:
+        """Add a LIMIT to the top-level SELECT statements of a query that don't have one.
+
+        Only SELECTs reading from a relation (or combining SELECTs with UNION etc.) are limited.
+        The statements are rewritten through their parse tree and marked with the applied limit.
+        Validation results may be cached, so a modified copy is returned and the given result is left as is.
+
+        Args:
+            validated_query: Validation result of the query
+            limit: Row limit to add, 0 leaves the query unchanged
+
+        Returns:
+            Validation result with the limited statements, or the given result if none was limited
+        """
+        if limit <= 0:
+            return validated_query
+
+        statements = []
+        for statement in validated_query.statements:
+            limited_query = None
+            if statement.command == SQLQueryCommand.SELECT and statement.query:
+                limited_query = self._limit_select(statement.query, limit)
+            if limited_query is None:
+                statements.append(statement)
+            else:
+                logger.debug(f"Added LIMIT {limit} to statement: {limited_query[:100]}")
+                statements.append(statement.model_copy(update={"query": limited_query, "limit_applied": limit}))
+
+        if all(new is old for new, old in zip(statements, validated_query.statements, strict=True)):
+            return validated_query
+        return validated_query.model_copy(update={"statements": statements})
+
+    def _limit_select(self, query: str, limit: int) -> str | None:
+        """Rewrite a single SELECT statement with a LIMIT, or return None if it shouldn't be limited."""
+        try:
+            parse_tree = parse_sql(query)
+        except ParseError:
+            return None
+        if len(parse_tree) != 1:
+            return None
+        select = parse_tree[0].stmt
+        if (
+            not isinstance(select, ast.SelectStmt)
+            or select.limitCount is not None  # Has a LIMIT or FETCH FIRST already
+            or select.intoClause is not None  # SELECT INTO creates a table
+            or (select.op == 0 and not select.fromClause)  # Plain expressions or VALUES, e.g. SELECT now()
+        ):
+            return None
+        select.limitCount = ast.A_Const(val=ast.Integer(ival=limit))
+        select.limitOption = LimitOption.LIMIT_OPTION_COUNT
+        return RawStream()(select)
+
     def _map_to_command(self, stmt_type: str) -> SQLQueryCommand:
         """Map a pglast statement type to our SQLQueryCommand enum."""
 
@@ -202,6 +372,17 @@ class SQLValidator:
         # Try to map the statement type, default to UNKNOWN
         return mapping.get(stmt_type, SQLQueryCommand.UNKNOWN)
 
+    def _returns_rows(self, stmt_type: str, stmt_node: Any, category: SQLQueryCategory) -> bool:
+        """Check whether executing a statement can return rows.
+
+        DML only returns rows through a RETURNING clause, DDL and DCL never do. Anything else is
+        assumed to return rows.
+        """
+        if stmt_type in ("InsertStmt", "UpdateStmt", "DeleteStmt", "MergeStmt"):
+            returning = getattr(stmt_node, "returningClause", None) or getattr(stmt_node, "returningList", None)
+            return bool(returning)
+        return category not in (SQLQueryCategory.DDL, SQLQueryCategory.DCL)
+
     def validate_statements(self, original_query: str, parse_tree: Any) -> QueryValidationResults:
         """Validate the statements in the parse tree.
 
@@ -272,6 +453,7 @@ class SQLValidator:
                     query=original_query[stmt.stmt_location : stmt.stmt_location + stmt.stmt_len]
                     if hasattr(stmt, "stmt_location") and hasattr(stmt, "stmt_len")
                     else None,
+                    returns_rows=self._returns_rows(stmt_type, stmt_node, classification["category"]),
                 )
                 # logger.debug(f"Isolated query: {query_result.query}")
                 logger.debug(
@@ -26,6 +26,12 @@ SUPPORTED_REGIONS = Literal[
     "sa-east-1",  # South America (São Paulo)
 ]
 
+CONNECTION_MODES = Literal[
+    "transaction",  # Supavisor transaction pooler (port 6543) - no server-side prepared statements
+    "session",  # Supavisor session pooler (port 5432)
+    "direct",  # Direct connection to the database host
+]
+
 
 def find_config_file(env_file: str = ".env") -> str | None:
     """Find the specified env file in order of precedence:
@@ -80,6 +86,57 @@ class Settings(BaseSettings):
         description="Supabase region for connection",
         alias="SUPABASE_REGION",
     )
+    supabase_connection_mode: CONNECTION_MODES = Field(
+        default="transaction",
+        description="How to connect to a remote database: transaction pooler, session pooler or direct connection",
+        alias="SUPABASE_CONNECTION_MODE",
+    )
+    db_statement_cache_size: int = Field(
+        default=100,
+        description="Number of prepared statements cached per connection, used when the connection mode allows it",
+        alias="DB_STATEMENT_CACHE_SIZE",
+        ge=0,
+    )
+    db_pool_min_size: int = Field(
+        default=2,
+        description="Number of database connections kept open in the pool",
+        alias="DB_POOL_MIN_SIZE",
+        ge=0,
+    )
+    db_pool_max_size: int = Field(
+        default=10,
+        description="Maximum number of database connections in the pool",
+        alias="DB_POOL_MAX_SIZE",
+        gt=0,
+    )
+    db_pool_adaptive: bool = Field(
+        default=False,
+        description="Adapt the number of connections in use to the acquire wait times and refused connections",
+        alias="DB_POOL_ADAPTIVE",
+    )
+    db_pool_acquire_wait_target_ms: float = Field(
+        default=50.0,
+        description="95th percentile connection acquire wait in milliseconds above which the adaptive pool grows",
+        alias="DB_POOL_ACQUIRE_WAIT_TARGET_MS",
+        gt=0,
+    )
+    db_pool_warmup: bool = Field(
+        default=False,
+        description="Start connecting the pool in the background at startup instead of on the first database call",
+        alias="DB_POOL_WARMUP",
+    )
+    db_command_timeout: float = Field(
+        default=30.0,
+        description="Default timeout in seconds of a database command",
+        alias="DB_COMMAND_TIMEOUT",
+        gt=0,
+    )
+    db_max_inactive_connection_lifetime: float = Field(
+        default=300.0,
+        description="Seconds after which an idle pooled connection is closed, 0 keeps idle connections open",
+        alias="DB_MAX_INACTIVE_CONNECTION_LIFETIME",
+        ge=0,
+    )
     supabase_access_token: str | None = Field(
         default=None,
         description="Optional personal access token for accessing Supabase Management API",
@@ -96,6 +153,167 @@ class Settings(BaseSettings):
         description="Supabase API URL",
     )
 
+    http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for the Management and Query API clients when the h2 package is installed",
+        alias="HTTP2",
+    )
+    http_max_connections: int = Field(
+        default=20,
+        description="Maximum number of open connections per HTTP API client",
+        alias="HTTP_MAX_CONNECTIONS",
+        gt=0,
+    )
+    http_max_keepalive_connections: int = Field(
+        default=10,
+        description="Maximum number of idle connections kept alive per HTTP API client",
+        alias="HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        ge=0,
+    )
+    http_keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle HTTP connection is kept alive",
+        alias="HTTP_KEEPALIVE_EXPIRY",
+        ge=0,
+    )
+    http_connect_timeout: float = Field(
+        default=5.0,
+        description="Timeout in seconds for opening a connection to an HTTP API",
+        alias="HTTP_CONNECT_TIMEOUT",
+        gt=0,
+    )
+    http_read_timeout: float = Field(
+        default=30.0,
+        description="Timeout in seconds for reading, writing or waiting for a pooled connection of an HTTP API",
+        alias="HTTP_READ_TIMEOUT",
+        gt=0,
+    )
+
+    query_max_rows: int = Field(
+        default=10_000,
+        description="Maximum number of rows returned per statement before the result is truncated",
+        alias="QUERY_MAX_ROWS",
+        gt=0,
+    )
+    query_max_result_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        description="Approximate byte budget per statement result before the result is truncated",
+        alias="QUERY_MAX_RESULT_BYTES",
+        gt=0,
+    )
+    query_default_limit: int = Field(
+        default=0,
+        description="LIMIT added to SELECT statements without one in execute_postgresql, 0 disables it",
+        alias="QUERY_DEFAULT_LIMIT",
+        ge=0,
+    )
+    query_stream_chunk_size: int = Field(
+        default=500,
+        description="Number of rows fetched per round trip when streaming read-only results through a cursor",
+        alias="QUERY_STREAM_CHUNK_SIZE",
+        gt=0,
+    )
+
+    query_retry_attempts: int = Field(
+        default=3,
+        description="Attempts for read-only queries interrupted by a lost connection, writes are never replayed",
+        alias="QUERY_RETRY_ATTEMPTS",
+        ge=1,
+    )
+
+    query_parallel_reads: bool = Field(
+        default=False,
+        description="Run batches of read-only statements concurrently on separate pooled connections",
+        alias="QUERY_PARALLEL_READS",
+    )
+    query_parallel_read_limit: int = Field(
+        default=4,
+        description="Maximum number of read-only statements of one batch running at the same time",
+        alias="QUERY_PARALLEL_READ_LIMIT",
+        gt=0,
+    )
+
+    sql_validation_cache_size: int = Field(
+        default=256,
+        description="Number of SQL validation results kept in the validator's LRU cache, 0 disables caching",
+        alias="SQL_VALIDATION_CACHE_SIZE",
+        ge=0,
+    )
+    sql_parse_offload_threshold: int = Field(
+        default=20_000,
+        description="Query length in characters from which SQL parsing moves off the event loop to a worker thread",
+        alias="SQL_PARSE_OFFLOAD_THRESHOLD",
+        ge=0,
+    )
+    sql_parse_workers: int = Field(
+        default=2,
+        description="Number of worker threads used to parse large SQL queries",
+        alias="SQL_PARSE_WORKERS",
+        gt=0,
+    )
+
+    catalog_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds that schema, table and column metadata is cached for, 0 disables caching",
+        alias="CATALOG_CACHE_TTL",
+        ge=0,
+    )
+    catalog_cache_schemas_ttl: float | None = Field(
+        default=None,
+        description="Seconds that the schema list is cached for, defaults to CATALOG_CACHE_TTL",
+        alias="CATALOG_CACHE_SCHEMAS_TTL",
+        ge=0,
+    )
+    catalog_cache_tables_ttl: float | None = Field(
+        default=None,
+        description="Seconds that the table list of a schema is cached for, defaults to CATALOG_CACHE_TTL",
+        alias="CATALOG_CACHE_TABLES_TTL",
+        ge=0,
+    )
+    catalog_cache_table_schema_ttl: float | None = Field(
+        default=None,
+        description="Seconds that the columns of a table are cached for, defaults to CATALOG_CACHE_TTL",
+        alias="CATALOG_CACHE_TABLE_SCHEMA_TTL",
+        ge=0,
+    )
+    catalog_cache_size: int = Field(
+        default=256,
+        description="Maximum number of catalog metadata results kept in the cache",
+        alias="CATALOG_CACHE_SIZE",
+        ge=0,
+    )
+
+    feature_access_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a granted feature access is cached before asking the Query API again, 0 disables it",
+        alias="FEATURE_ACCESS_CACHE_TTL",
+        ge=0,
+    )
+    feature_access_denied_ttl: float = Field(
+        default=60.0,
+        description="Seconds a denied feature access is cached before asking the Query API again, 0 disables it",
+        alias="FEATURE_ACCESS_DENIED_TTL",
+        ge=0,
+    )
+    feature_access_refresh_interval: float = Field(
+        default=240.0,
+        description="Seconds between background refreshes of the access to all features, 0 only loads it at startup",
+        alias="FEATURE_ACCESS_REFRESH_INTERVAL",
+        ge=0,
+    )
+    feature_access_stale_ttl: float = Field(
+        default=3600.0,
+        description="Seconds a feature access grant is still honoured while the Query API is unreachable",
+        alias="FEATURE_ACCESS_STALE_TTL",
+        ge=0,
+    )
+
+    feature_access_speculative: bool = Field(
+        default=True,
+        description="Start read-only tools while their feature access is checked, releasing results once granted",
+        alias="FEATURE_ACCESS_SPECULATIVE",
+    )
+
     query_api_key: str = Field(
         default="test-key",
         description="TheQuery.dev API key",
@@ -130,6 +348,15 @@ class Settings(BaseSettings):
             raise ValueError(f"Region '{v}' is not supported. Supported regions are:{supported}")
         return v
 
+    @field_validator("db_pool_max_size")
+    @classmethod
+    def validate_pool_max_size(cls, v: int, info: ValidationInfo) -> int:
+        """Validate that the pool can hold its minimum number of connections."""
+        min_size = info.data.get("db_pool_min_size", 0)
+        if v < min_size:
+            raise ValueError(f"DB_POOL_MAX_SIZE ({v}) must be at least DB_POOL_MIN_SIZE ({min_size})")
+        return v
+
     @field_validator("supabase_project_ref")
     @classmethod
     def validate_project_ref(cls, v: str) -> str:
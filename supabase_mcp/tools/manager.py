@@ -15,8 +15,10 @@ class ToolName(str, Enum):
     GET_SCHEMAS = "get_schemas"
     GET_TABLES = "get_tables"
     GET_TABLE_SCHEMA = "get_table_schema"
+    GET_TABLE_SCHEMAS = "get_table_schemas"
     EXECUTE_POSTGRESQL = "execute_postgresql"
     RETRIEVE_MIGRATIONS = "retrieve_migrations"
+    GET_POOL_STATS = "get_pool_stats"
 
     # Safety tools
     LIVE_DANGEROUSLY = "live_dangerously"
@@ -25,6 +27,7 @@ class ToolName(str, Enum):
     # Management API tools
     SEND_MANAGEMENT_API_REQUEST = "send_management_api_request"
     GET_MANAGEMENT_API_SPEC = "get_management_api_spec"
+    GET_API_STATS = "get_api_stats"
 
     # Auth Admin tools
     GET_AUTH_ADMIN_METHODS_SPEC = "get_auth_admin_methods_spec"
@@ -2,7 +2,9 @@ from typing import Any, Literal
 
 from mcp.server.fastmcp import FastMCP
 
+from supabase_mcp.clients.http_middleware import EndpointStats
 from supabase_mcp.core.container import ServicesContainer
+from supabase_mcp.services.database.pool_monitor import PoolStats
 from supabase_mcp.services.database.postgres_client import QueryResult
 from supabase_mcp.tools.manager import ToolName
 
@@ -28,10 +30,16 @@ class ToolRegistry:
             return await feature_manager.execute_tool(ToolName.GET_SCHEMAS, services_container=services_container)
 
         @mcp.tool(description=tool_manager.get_description(ToolName.GET_TABLES))  # type: ignore
-        async def get_tables(schema_name: str) -> QueryResult:
+        async def get_tables(
+            schema_name: str, result_format: Literal["rows", "columnar"] = "rows", fast: bool = False
+        ) -> QueryResult:
             """List all tables, foreign tables, and views in a schema with their sizes, row counts, and metadata."""
             return await feature_manager.execute_tool(
-                ToolName.GET_TABLES, services_container=services_container, schema_name=schema_name
+                ToolName.GET_TABLES,
+                services_container=services_container,
+                schema_name=schema_name,
+                result_format=result_format,
+                fast=fast,
             )
 
         @mcp.tool(description=tool_manager.get_description(ToolName.GET_TABLE_SCHEMA))  # type: ignore
@@ -44,14 +52,31 @@ class ToolRegistry:
                 table=table,
             )
 
+        @mcp.tool(description=tool_manager.get_description(ToolName.GET_TABLE_SCHEMAS))  # type: ignore
+        async def get_table_schemas(schema_name: str, tables: list[str] | None = None) -> QueryResult:
+            """Get the structure of several tables, or of every table in a schema, in one call."""
+            return await feature_manager.execute_tool(
+                ToolName.GET_TABLE_SCHEMAS,
+                services_container=services_container,
+                schema_name=schema_name,
+                tables=tables,
+            )
+
         @mcp.tool(description=tool_manager.get_description(ToolName.EXECUTE_POSTGRESQL))  # type: ignore
-        async def execute_postgresql(query: str, migration_name: str = "") -> QueryResult:
+        async def execute_postgresql(
+            query: str,
+            migration_name: str = "",
+            result_format: Literal["rows", "columnar"] = "rows",
+            timeout: float | None = None,
+        ) -> QueryResult:
             """Execute PostgreSQL statements against your Supabase database."""
             return await feature_manager.execute_tool(
                 ToolName.EXECUTE_POSTGRESQL,
                 services_container=services_container,
                 query=query,
                 migration_name=migration_name,
+                result_format=result_format,
+                timeout=timeout,
             )
 
         @mcp.tool(description=tool_manager.get_description(ToolName.RETRIEVE_MIGRATIONS))  # type: ignore
@@ -76,6 +101,11 @@ class ToolRegistry:
             )
             return QueryResult.model_validate(result)
 
+        @mcp.tool(description=tool_manager.get_description(ToolName.GET_POOL_STATS))  # type: ignore
+        async def get_pool_stats() -> PoolStats:
+            """Get the usage and acquire latencies of the database connection pool."""
+            return await feature_manager.execute_tool(ToolName.GET_POOL_STATS, services_container=services_container)
+
         @mcp.tool(description=tool_manager.get_description(ToolName.SEND_MANAGEMENT_API_REQUEST))  # type: ignore
         async def send_management_api_request(
             method: str,
@@ -119,6 +149,11 @@ class ToolRegistry:
                 ToolName.GET_MANAGEMENT_API_SPEC, services_container=services_container, params=params
             )
 
+        @mcp.tool(description=tool_manager.get_description(ToolName.GET_API_STATS))  # type: ignore
+        async def get_api_stats() -> dict[str, dict[str, EndpointStats]]:
+            """Get the request latencies, errors and response sizes of the HTTP API clients, per endpoint."""
+            return await feature_manager.execute_tool(ToolName.GET_API_STATS, services_container=services_container)
+
         @mcp.tool(description=tool_manager.get_description(ToolName.GET_AUTH_ADMIN_METHODS_SPEC))  # type: ignore
         async def get_auth_admin_methods_spec() -> dict[str, Any]:
             """Get Python SDK methods specification for Auth Admin."""
@@ -0,0 +1,89 @@
+import os
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from supabase_mcp.logger import logger
+from supabase_mcp.services.database.postgres_client import PostgresClient
+from supabase_mcp.services.database.sql.loader import SQLLoader
+from supabase_mcp.services.database.sql.validator import SQLValidator
+
+# Benchmarks create and drop up to a thousand tables, so they only run when asked for
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.integration,
+    pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="Set RUN_BENCHMARKS=1 to run the benchmarks"),
+]
+
+BASELINE_QUERY_PATH = Path(__file__).parent / "get_tables_baseline.sql"
+
+# Timed runs per query after one untimed warm-up run, the median of which is reported
+RUNS = int(os.getenv("BENCHMARK_RUNS", "5"))
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestGetTablesBenchmark:
+    """Benchmark of the get_tables query on schemas with a growing number of tables."""
+
+    SCHEMA = "mcp_get_tables_benchmark"
+
+    @staticmethod
+    async def time_query(client: PostgresClient, query: str, params: list | None = None) -> tuple[float, list[dict]]:
+        """Run a query once to warm up, then return its median duration in seconds over RUNS runs and its rows."""
+        validated_query = SQLValidator().validate_query(query)
+        result = await client.execute_query(validated_query, params=params)
+        durations = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            await client.execute_query(validated_query, params=params)
+            durations.append(time.perf_counter() - start)
+        return statistics.median(durations), result.results[0].rows
+
+    @pytest.mark.parametrize("table_count", [10, 100, 1000])
+    async def test_get_tables_scaling(self, postgres_client_integration: PostgresClient, table_count: int):
+        """Time the previous get_tables query against the exact and fast modes, which describe the same tables."""
+        client = postgres_client_integration
+
+        async def create_tables(conn):
+            await conn.execute(f"DROP SCHEMA IF EXISTS {self.SCHEMA} CASCADE")
+            await conn.execute(f"CREATE SCHEMA {self.SCHEMA}")
+            await conn.execute(
+                f"""
+                DO $$
+                BEGIN
+                    FOR i IN 1..{table_count} LOOP
+                        EXECUTE format(
+                            'CREATE TABLE {self.SCHEMA}.t_%s (id int PRIMARY KEY, value int, created_at timestamptz)',
+                            i
+                        );
+                    END LOOP;
+                END $$;
+                """
+            )
+
+        await client.with_connection(create_tables)
+        try:
+            baseline_query = BASELINE_QUERY_PATH.read_text().replace("{schema_name}", self.SCHEMA)
+            timings = {}
+            timings["baseline"], baseline_rows = await self.time_query(client, baseline_query)
+            expected_tables = {row["table_name"] for row in baseline_rows}
+            assert len(expected_tables) == table_count
+
+            for fast in (False, True):
+                query = SQLLoader.get_tables_query(self.SCHEMA, fast=fast)
+                mode = "fast" if fast else "exact"
+                timings[mode], rows = await self.time_query(client, query.query, query.params)
+
+                assert {row["table_name"] for row in rows} == expected_tables
+                assert all(row["column_count"] == 3 and row["index_count"] == 1 for row in rows)
+                assert all(row["table_type"] == "BASE TABLE" for row in rows)
+
+            logger.info(
+                f"get_tables with {table_count} tables, median of {RUNS} runs: "
+                f"baseline {timings['baseline'] * 1000:.1f} ms, exact {timings['exact'] * 1000:.1f} ms, "
+                f"fast {timings['fast'] * 1000:.1f} ms"
+            )
+        finally:
+            await client.with_connection(lambda conn: conn.execute(f"DROP SCHEMA IF EXISTS {self.SCHEMA} CASCADE"))
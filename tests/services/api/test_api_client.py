@@ -1,8 +1,12 @@
+from unittest.mock import patch
+
 import httpx
 import pytest
 
+from supabase_mcp.clients.base_http_client import create_http_client, http2_available
 from supabase_mcp.clients.management_client import ManagementAPIClient
 from supabase_mcp.exceptions import APIClientError, APIConnectionError
+from supabase_mcp.settings import Settings
 
 
 @pytest.mark.asyncio(loop_scope="module")
@@ -146,3 +150,121 @@ class TestAPIClient:
                 method="GET",
                 path="/v1/projects",
             )
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.unit
+class TestHTTPClientOptions:
+    """Unit tests for the connection options of the HTTP API clients."""
+
+    async def test_client_uses_configured_limits_and_timeouts(self):
+        """Clients get HTTP/2, the connection limits and separate connect and read timeouts."""
+        settings = Settings(HTTP_MAX_CONNECTIONS=5, HTTP_KEEPALIVE_EXPIRY=15, HTTP_CONNECT_TIMEOUT=2)
+        client = create_http_client("https://api.example.com", {}, settings)
+        try:
+            pool = client._transport._pool
+            assert pool._http2 is True
+            assert pool._max_connections == 5
+            assert pool._keepalive_expiry == 15
+            assert client.timeout == httpx.Timeout(30.0, connect=2.0)
+        finally:
+            await client.aclose()
+
+    async def test_http2_falls_back_without_h2(self):
+        """Without the h2 package the clients use HTTP/1.1."""
+        http2_available.cache_clear()
+        try:
+            with patch("supabase_mcp.clients.base_http_client.find_spec", return_value=None):
+                client = create_http_client("https://api.example.com", {}, Settings())
+            assert client._transport._pool._http2 is False
+            await client.aclose()
+        finally:
+            http2_available.cache_clear()
+
+    async def test_management_client_shares_the_client_options(self):
+        """The Management API client is built with the shared connection options."""
+        client = ManagementAPIClient(Settings(HTTP_READ_TIMEOUT=10))
+        try:
+            assert client.client.timeout.read == 10
+            assert client.client.headers["Content-Type"] == "application/json"
+        finally:
+            await client.close()
+
+
+def make_mock_client(handler) -> ManagementAPIClient:
+    """Create a Management API client whose requests are answered by the handler."""
+    client = ManagementAPIClient(Settings(SUPABASE_ACCESS_TOKEN="token"))
+    client.client = httpx.AsyncClient(base_url="https://api.example.com", transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.unit
+class TestHTTPRequestPipeline:
+    """Unit tests for the request pipeline shared by the HTTP API clients."""
+
+    async def test_requests_are_recorded_per_endpoint(self):
+        """Latencies, response sizes and errors are recorded per endpoint."""
+        client = make_mock_client(
+            lambda request: httpx.Response(404 if "missing" in request.url.path else 200, json={"id": "abc"})
+        )
+
+        await client.execute_request("GET", "/v1/projects/abc", endpoint="GET /v1/projects/{ref}")
+        await client.execute_request("GET", "/v1/projects/def", endpoint="GET /v1/projects/{ref}")
+        with pytest.raises(APIClientError):
+            await client.execute_request("GET", "/v1/missing")
+        stats = client.get_metrics()
+        await client.close()
+
+        project_stats = stats["GET /v1/projects/{ref}"]
+        assert project_stats.requests == 2
+        assert project_stats.errors == 0
+        assert project_stats.response_bytes == 2 * len(b'{"id":"abc"}')
+        assert sum(project_stats.latency_buckets.values()) == 2
+        assert stats["GET /v1/missing"].errors == 1
+
+    async def test_added_middleware_runs_inside_timing(self):
+        """Added middleware can answer requests itself, which are still timed."""
+        client = make_mock_client(lambda request: pytest.fail("request should be served by the middleware"))
+        cached = httpx.Response(200, json={"cached": True})
+
+        async def cache_middleware(request: httpx.Request, call_next) -> httpx.Response:
+            return cached
+
+        client.add_middleware(cache_middleware)
+        result = await client.execute_request("GET", "/v1/projects")
+        await client.close()
+
+        assert result == {"cached": True}
+        assert client.metrics.stats()["GET /v1/projects"].requests == 1
+
+    async def test_network_errors_are_retried(self):
+        """Network errors are retried before failing with a connection error."""
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = make_mock_client(handler)
+        client.middleware[-1].min_wait = client.middleware[-1].max_wait = 0
+        with pytest.raises(APIConnectionError) as exc_info:
+            await client.execute_request("GET", "/v1/projects")
+        await client.close()
+
+        assert len(attempts) == 3
+        assert "Network error after 3 retry attempts" in str(exc_info.value)
+        assert client.metrics.stats()["GET /v1/projects"].errors == 1
+
+    async def test_timeouts_are_connection_errors(self):
+        """Timeouts fail with a connection error, so callers treat them like an unreachable API."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("Read timed out", request=request)
+
+        client = make_mock_client(handler)
+        with pytest.raises(APIConnectionError) as exc_info:
+            await client.execute_request("GET", "/v1/projects")
+        await client.close()
+
+        assert "Request timed out" in str(exc_info.value)
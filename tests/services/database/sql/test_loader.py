@@ -4,13 +4,20 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
-from supabase_mcp.services.database.sql.loader import SQLLoader
+from supabase_mcp.services.database.sql.loader import SQLLoader, SQLTemplate
 
 
 @pytest.mark.unit
 class TestSQLLoader:
     """Unit tests for the SQLLoader class."""
 
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        """Start every test with an empty template registry."""
+        SQLLoader.clear_templates()
+        yield
+        SQLLoader.clear_templates()
+
     def test_load_sql_with_extension(self):
         """Test loading SQL with file extension provided."""
         mock_sql = "SELECT * FROM test;"
@@ -47,34 +54,73 @@ class TestSQLLoader:
         assert result == mock_sql
 
     def test_get_tables_query(self):
-        """Test getting tables query with schema replacement."""
-        mock_sql = "SELECT * FROM {schema_name}.tables;"
-        expected = "SELECT * FROM test_schema.tables;"
+        """Test getting tables query with the schema bound as a parameter."""
+        mock_sql = "SELECT * FROM tables WHERE schema = {schema_name};"
 
-        with patch.object(SQLLoader, "load_sql", return_value=mock_sql):
+        with patch.object(SQLLoader, "get_template", return_value=SQLTemplate.parse("get_tables.sql", mock_sql)):
             result = SQLLoader.get_tables_query("test_schema")
 
-        assert result == expected
+        assert result.query == "SELECT * FROM tables WHERE schema = $1;"
+        assert result.params == ["test_schema"]
+
+    def test_get_tables_query_fast_mode(self):
+        """Test that fast mode only changes the bound estimate flag, not the query text."""
+        exact = SQLLoader.get_tables_query("public")
+        fast = SQLLoader.get_tables_query("public", fast=True)
+
+        assert exact.query == fast.query
+        assert "pg_total_relation_size" in exact.query
+        assert exact.params == ["public", False]
+        assert fast.params == ["public", True]
 
     def test_get_table_schema_query(self):
-        """Test getting table schema query with replacements."""
-        mock_sql = "SELECT * FROM {schema_name}.{table};"
-        expected = "SELECT * FROM test_schema.test_table;"
+        """Test getting table schema query with repeated placeholders sharing a parameter."""
+        mock_sql = "SELECT * FROM columns WHERE schema = {schema_name} AND table = {table} AND ns = {schema_name};"
 
-        with patch.object(SQLLoader, "load_sql", return_value=mock_sql):
+        template = SQLTemplate.parse("get_table_schema.sql", mock_sql)
+        with patch.object(SQLLoader, "get_template", return_value=template):
             result = SQLLoader.get_table_schema_query("test_schema", "test_table")
 
-        assert result == expected
+        assert result.query == "SELECT * FROM columns WHERE schema = $1 AND table = $2 AND ns = $1;"
+        assert result.params == ["test_schema", "test_table"]
+
+    def test_get_table_schemas_query(self):
+        """Test that the bulk table schema query binds the table list, or NULL for the whole schema."""
+        some_tables = SQLLoader.get_table_schemas_query("public", ["users", "orders"])
+        whole_schema = SQLLoader.get_table_schemas_query("public")
+
+        assert some_tables.query == whole_schema.query
+        assert some_tables.params == ["public", ["users", "orders"]]
+        assert whole_schema.params == ["public", None]
 
     def test_get_migrations_query(self):
         """Test getting migrations query with all parameters."""
-        mock_sql = "SELECT * FROM migrations WHERE name LIKE '%{name_pattern}%' LIMIT {limit} OFFSET {offset} AND include_queries = {include_full_queries};"
-        expected = "SELECT * FROM migrations WHERE name LIKE '%test%' LIMIT 10 OFFSET 5 AND include_queries = true;"
-
-        with patch.object(SQLLoader, "load_sql", return_value=mock_sql):
+        mock_sql = (
+            "SELECT * FROM migrations WHERE name LIKE '%' || {name_pattern} || '%' "
+            "AND {include_full_queries} LIMIT {limit} OFFSET {offset};"
+        )
+        expected = "SELECT * FROM migrations WHERE name LIKE '%' || $1 || '%' AND $2 LIMIT $3 OFFSET $4;"
+
+        template = SQLTemplate.parse("get_migrations.sql", mock_sql)
+        with patch.object(SQLLoader, "get_template", return_value=template):
             result = SQLLoader.get_migrations_query(limit=10, offset=5, name_pattern="test", include_full_queries=True)
 
-        assert result == expected
+        assert result.query == expected
+        assert result.params == ["test", True, 10, 5]
+
+    def test_parameterized_query_text_is_constant(self):
+        """Test that the query text doesn't change with the values, so it stays cacheable."""
+        first = SQLLoader.get_tables_query("public")
+        second = SQLLoader.get_tables_query("x'; DROP TABLE users; --")
+
+        assert first.query == second.query
+        assert "{schema_name}" not in first.query
+        assert second.params[0] == "x'; DROP TABLE users; --"
+
+    def test_render_parameterized_missing_value(self):
+        """Test that a placeholder without a value raises an error."""
+        with pytest.raises(ValueError):
+            SQLLoader.render_parameterized("SELECT {missing};")
 
     def test_get_init_migrations_query(self):
         """Test getting init migrations query."""
@@ -90,13 +136,43 @@ class TestSQLLoader:
         mock_sql = "INSERT INTO migrations VALUES ('{version}', '{name}', ARRAY['{statements}']);"
         expected = "INSERT INTO migrations VALUES ('20230101', 'test_migration', ARRAY['SELECT 1;']);"
 
-        with patch.object(SQLLoader, "load_sql", return_value=mock_sql):
+        template = SQLTemplate.parse("create_migration.sql", mock_sql)
+        with patch.object(SQLLoader, "get_template", return_value=template):
             result = SQLLoader.get_create_migration_query(
                 version="20230101", name="test_migration", statements="SELECT 1;"
             )
 
         assert result == expected
 
+    def test_templates_are_read_from_disk_once(self):
+        """Test that repeated loads are served from the registry."""
+        with patch("builtins.open", mock_open(read_data="SELECT 1;")) as opened:
+            with patch.object(Path, "exists", return_value=True):
+                for _ in range(3):
+                    SQLLoader.load_sql("cached")
+
+        assert opened.call_count == 1
+        stats = SQLLoader.template_stats()
+        assert stats["disk_reads"] == 1
+        assert stats["hits"] == 2
+
+    def test_preload_reads_all_templates(self):
+        """Test that preload registers every SQL file, including the log templates."""
+        count = SQLLoader.preload()
+
+        assert count == len(list(SQLLoader.SQL_DIR.rglob("*.sql")))
+        with patch("builtins.open", side_effect=AssertionError("disk read after preload")):
+            SQLLoader.get_tables_query("public")
+            SQLLoader.get_logs_query("postgres", where_clause="WHERE true", limit=5)
+        assert SQLLoader.template_stats()["disk_reads"] == count
+
+    def test_template_render(self):
+        """Test that text rendering leaves unknown placeholders and doesn't re-scan values."""
+        template = SQLTemplate.parse("t.sql", "SELECT {a}, {b} FROM x WHERE {a} LIMIT {limit};")
+
+        assert template.placeholders == ("a", "b", "a", "limit")
+        assert template.render(a="{b}", limit=5) == "SELECT {b}, {b} FROM x WHERE {b} LIMIT 5;"
+
     def test_sql_dir_path(self):
         """Test that SQL_DIR points to the correct location."""
         expected_path = Path(SQLLoader.__module__.replace(".", os.sep)).parent / "queries"
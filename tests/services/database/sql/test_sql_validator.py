@@ -505,6 +505,36 @@ class TestSQLValidator:
         )
         assert not SQLValidator.validate_transaction_control(""), "Should not detect in empty string"
 
+    def test_returns_rows_flag(self, mock_validator: SQLValidator):
+        """Statements are flagged by whether they can return rows."""
+        result = mock_validator.validate_query(
+            "CREATE TABLE t (id int); INSERT INTO t VALUES (1); INSERT INTO t VALUES (2) RETURNING id; "
+            "GRANT SELECT ON t TO anon; SELECT id FROM t;"
+        )
+
+        assert [statement.returns_rows for statement in result.statements] == [False, False, True, False, True]
+
+    def test_apply_row_limit(self, mock_validator: SQLValidator):
+        """Only top-level SELECTs reading rows without a LIMIT get the row limit."""
+        result = mock_validator.validate_query(
+            "SELECT * FROM events; SELECT now(); SELECT * FROM events FETCH FIRST 3 ROWS ONLY; "
+            "SELECT id FROM a UNION SELECT id FROM b; SELECT * FROM events OFFSET 10; DELETE FROM events;"
+        )
+
+        limited = mock_validator.apply_row_limit(result, 50)
+
+        assert [statement.query for statement in limited.statements] == [
+            "SELECT * FROM events LIMIT 50",
+            "SELECT now()",
+            "SELECT * FROM events FETCH FIRST 3 ROWS ONLY",
+            "SELECT id FROM a UNION SELECT id FROM b LIMIT 50",
+            "SELECT * FROM events LIMIT 50 OFFSET 10",
+            "DELETE FROM events",
+        ]
+        assert [statement.limit_applied for statement in limited.statements] == [50, None, None, 50, 50, None]
+        assert result.statements[0].query == "SELECT * FROM events"
+        assert mock_validator.apply_row_limit(result, 0) is result
+
     def test_basic_query_validation_method(self, mock_validator: SQLValidator):
         """
         Test the basic_query_validation method.
@@ -527,3 +557,91 @@ class TestSQLValidator:
         # Test whitespace-only query
         with pytest.raises(ValidationError, match="Query cannot be empty"):
             mock_validator.basic_query_validation("   \n   \t   ")
+
+    # =========================================================================
+    # Validation Cache Tests
+    # =========================================================================
+
+    def test_validation_cache_returns_cached_result(self, mock_validator: SQLValidator):
+        """Test that validating the same query twice parses it only once."""
+        query = "SELECT * FROM users WHERE id = 1"
+
+        first = mock_validator.validate_query(query)
+        second = mock_validator.validate_query(query)
+
+        assert second is first
+        assert mock_validator.cache_info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 256}
+
+    def test_validation_cache_evicts_least_recently_used(self):
+        """Test that the cache is bounded and evicts the least recently used entry."""
+        validator = SQLValidator(cache_size=2)
+
+        validator.validate_query("SELECT 1")
+        validator.validate_query("SELECT 2")
+        validator.validate_query("SELECT 1")  # Refresh "SELECT 1"
+        validator.validate_query("SELECT 3")  # Evicts "SELECT 2"
+
+        assert validator.cache_info()["size"] == 2
+        validator.validate_query("SELECT 1")
+        assert validator.cache_hits == 2
+        validator.validate_query("SELECT 2")
+        assert validator.cache_misses == 4
+
+    def test_validation_cache_disabled(self):
+        """Test that a cache size of 0 disables caching."""
+        validator = SQLValidator(cache_size=0)
+
+        first = validator.validate_query("SELECT 1")
+        second = validator.validate_query("SELECT 1")
+
+        assert second is not first
+        assert validator.cache_info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 0}
+
+    def test_validation_cache_does_not_store_invalid_queries(self, mock_validator: SQLValidator):
+        """Test that rejected queries are not cached and keep failing."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                mock_validator.validate_query("BEGIN; SELECT 1; COMMIT;")
+
+        assert mock_validator.cache_info()["size"] == 0
+
+    # =========================================================================
+    # Async Validation Tests
+    # =========================================================================
+
+    async def test_validate_query_async_small_query_inline(self):
+        """Test that small queries are validated inline without starting worker threads."""
+        validator = SQLValidator(offload_threshold=1_000)
+
+        result = await validator.validate_query_async("SELECT * FROM users")
+
+        assert result.statements[0].category == SQLQueryCategory.DQL
+        assert validator._executor is None
+
+    async def test_validate_query_async_offloads_large_query(self):
+        """Test that large queries are parsed in a worker thread and give the same result."""
+        validator = SQLValidator(offload_threshold=100, max_workers=1)
+        query = "\n".join(f"INSERT INTO users (id, name) VALUES ({i}, 'user_{i}');" for i in range(50))
+
+        try:
+            result = await validator.validate_query_async(query)
+
+            assert validator._executor is not None
+            assert len(result.statements) == 50
+            assert all(statement.category == SQLQueryCategory.DML for statement in result.statements)
+            # The worker thread stored the result in the shared cache, looked up once per call
+            assert await validator.validate_query_async(query) is result
+            assert validator.cache_info()["hits"] == 1
+            assert validator.cache_info()["misses"] == 1
+        finally:
+            validator.shutdown()
+
+    async def test_validate_query_async_propagates_validation_errors(self):
+        """Test that validation errors raised in the worker thread reach the caller."""
+        validator = SQLValidator(offload_threshold=10)
+
+        try:
+            with pytest.raises(ValidationError, match="SQL syntax error"):
+                await validator.validate_query_async("SELECT * FROM WHERE id = 1 AND name = 'x'")
+        finally:
+            validator.shutdown()
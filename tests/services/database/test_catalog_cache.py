@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+import pytest
+
+from supabase_mcp.services.database.catalog_cache import CatalogCache, CatalogObject
+from supabase_mcp.services.database.postgres_client import QueryResult, ResultFormat, StatementResult
+from supabase_mcp.services.database.sql.validator import SQLValidator
+
+
+def make_result(name: str) -> QueryResult:
+    return QueryResult(results=[StatementResult(rows=[{"name": name}])])
+
+
+@pytest.mark.unit
+class TestCatalogCache:
+    """Unit tests for the catalog metadata cache."""
+
+    def test_get_returns_cached_result_with_age(self):
+        """Cached results are returned as copies that report their age."""
+        cache = CatalogCache(ttl=60)
+        result = make_result("users")
+
+        with patch("supabase_mcp.services.database.catalog_cache.time.monotonic", side_effect=[100.0, 102.5]):
+            cache.put(result, CatalogObject.TABLES, "public")
+            cached = cache.get(CatalogObject.TABLES, "public")
+
+        assert cached is not None
+        assert cached.results == result.results
+        assert cached.cache_age_seconds == 2.5
+        assert result.cache_age_seconds is None
+        assert cache.cache_info()["hits"] == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than their TTL are dropped."""
+        cache = CatalogCache(ttl=10)
+
+        with patch("supabase_mcp.services.database.catalog_cache.time.monotonic", side_effect=[0.0, 5.0, 6.0, 11.0]):
+            cache.put(make_result("users"), CatalogObject.SCHEMAS)
+            cache.put(make_result("users"), CatalogObject.TABLES, "public", ttl=1)
+            assert cache.get(CatalogObject.TABLES, "public") is None
+            assert cache.get(CatalogObject.SCHEMAS) is None
+
+        assert cache.cache_info()["size"] == 0
+
+    def test_zero_ttl_skips_entry(self):
+        """An entry with a TTL of 0 isn't stored at all."""
+        cache = CatalogCache(ttl=60)
+        cache.put(make_result("users"), CatalogObject.TABLES, "public", ttl=0)
+
+        assert cache.cache_info()["size"] == 0
+
+    def test_keys_include_table_and_format(self):
+        """Results are cached per table and per result format."""
+        cache = CatalogCache()
+        cache.put(make_result("a"), CatalogObject.TABLE_SCHEMA, "public", "a")
+
+        assert cache.get(CatalogObject.TABLE_SCHEMA, "public", "b") is None
+        assert cache.get(CatalogObject.TABLE_SCHEMA, "public", "a", ResultFormat.COLUMNAR) is None
+        assert cache.get(CatalogObject.TABLE_SCHEMA, "public", "a") is not None
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when the cache is full."""
+        cache = CatalogCache(max_size=2)
+        cache.put(make_result("a"), CatalogObject.TABLES, "a")
+        cache.put(make_result("b"), CatalogObject.TABLES, "b")
+        cache.get(CatalogObject.TABLES, "a")
+        cache.put(make_result("c"), CatalogObject.TABLES, "c")
+
+        assert cache.get(CatalogObject.TABLES, "a") is not None
+        assert cache.get(CatalogObject.TABLES, "b") is None
+
+    def test_ddl_invalidates_only_its_schema(self):
+        """DDL on a named schema drops that schema's entries and the schema list."""
+        cache = CatalogCache()
+        cache.put(make_result("schemas"), CatalogObject.SCHEMAS)
+        cache.put(make_result("a"), CatalogObject.TABLES, "analytics")
+        cache.put(make_result("b"), CatalogObject.TABLES, "billing")
+
+        cache.invalidate_for(SQLValidator().validate_query("ALTER TABLE analytics.events ADD COLUMN x INT;"))
+
+        assert cache.get(CatalogObject.SCHEMAS) is None
+        assert cache.get(CatalogObject.TABLES, "analytics") is None
+        assert cache.get(CatalogObject.TABLES, "billing") is not None
+
+    def test_ddl_without_explicit_schema_clears_cache(self):
+        """DDL reported on the default schema may target any schema, so everything is dropped."""
+        cache = CatalogCache()
+        cache.put(make_result("b"), CatalogObject.TABLES, "billing")
+
+        cache.invalidate_for(SQLValidator().validate_query("DROP TABLE billing.invoices;"))
+
+        assert cache.get(CatalogObject.TABLES, "billing") is None
+
+    def test_non_ddl_keeps_entries(self):
+        """Read and write statements don't invalidate catalog entries."""
+        cache = CatalogCache()
+        cache.put(make_result("a"), CatalogObject.TABLES, "public")
+
+        cache.invalidate_for(SQLValidator().validate_query("INSERT INTO public.users (id) VALUES (1);"))
+
+        assert cache.get(CatalogObject.TABLES, "public") is not None
+
+    def test_zero_ttl_disables_cache(self):
+        """A TTL of 0 turns caching off."""
+        cache = CatalogCache(ttl=0)
+        cache.put(make_result("a"), CatalogObject.SCHEMAS)
+
+        assert cache.get(CatalogObject.SCHEMAS) is None
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from supabase_mcp.services.database.pool_monitor import PoolMonitor
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.unit
+class TestPoolMonitor:
+    """Unit tests for the connection pool monitor and adaptive sizing."""
+
+    async def test_slots_are_limited_to_target_size(self):
+        """Operations beyond the target size wait for a slot and are counted as waiters."""
+        monitor = PoolMonitor(min_size=1, max_size=2)
+        release = asyncio.Event()
+
+        async def hold():
+            async with monitor.slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert monitor.in_use == 2
+        assert monitor.waiters == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert monitor.in_use == 0
+        assert monitor.waiters == 0
+
+    async def test_cancelled_operations_free_their_slot(self):
+        """Cancelling an operation releases its slot, or its place in the queue, immediately."""
+        monitor = PoolMonitor(min_size=1, max_size=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with monitor.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        assert (monitor.in_use, monitor.waiters) == (1, 1)
+
+        queued.cancel()
+        await asyncio.sleep(0)
+        assert (monitor.in_use, monitor.waiters) == (1, 0)
+
+        holder.cancel()
+        await asyncio.sleep(0)
+        assert monitor.in_use == 0
+
+    async def test_stats_report_acquire_percentiles(self):
+        """Acquire waits are reported as percentiles in milliseconds."""
+        monitor = PoolMonitor(min_size=2, max_size=10)
+        for wait in range(1, 101):
+            monitor.record_acquire(wait / 1000)
+
+        stats = monitor.stats(size=3, idle=3)
+
+        assert stats.acquires == 100
+        assert (stats.acquire_p50_ms, stats.acquire_p95_ms, stats.acquire_p99_ms) == (50.0, 95.0, 99.0)
+        assert stats.target_size == 10
+        assert monitor.stats().acquire_p50_ms == 50.0
+        assert PoolMonitor(min_size=2, max_size=10).stats().acquire_p50_ms is None
+
+    async def test_adaptive_target_grows_on_slow_acquires(self):
+        """The adaptive target starts at the minimum and grows while acquires wait too long."""
+        monitor = PoolMonitor(min_size=2, max_size=3, adaptive=True, wait_target_ms=10)
+        assert monitor.target_size == 2
+
+        for _ in range(2 * PoolMonitor.ADJUST_EVERY):
+            monitor.record_acquire(0.050)
+
+        # Growth stops at the maximum
+        assert monitor.target_size == 3
+
+    async def test_adaptive_target_backs_off_on_refused_connections(self):
+        """Refused connections halve the target, and an idle pool shrinks back to the minimum."""
+        monitor = PoolMonitor(min_size=1, max_size=8, adaptive=True)
+        monitor.target_size = 8
+
+        monitor.record_too_many_connections()
+        assert monitor.target_size == 4
+        assert monitor.too_many_connections == 1
+
+        for _ in range(PoolMonitor.ADJUST_EVERY):
+            monitor.record_acquire(0.0)
+        assert monitor.target_size == 3
+
+    async def test_fixed_target_without_adaptive_mode(self):
+        """Without adaptive mode the target stays at the configured maximum."""
+        monitor = PoolMonitor(min_size=1, max_size=8)
+
+        monitor.record_too_many_connections()
+        for _ in range(PoolMonitor.ADJUST_EVERY):
+            monitor.record_acquire(1.0)
+
+        assert monitor.target_size == 8
@@ -1,10 +1,14 @@
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import asyncpg
 import pytest
 
-from supabase_mcp.exceptions import SafetyError
+from supabase_mcp.exceptions import QueryError, SafetyError
+from supabase_mcp.services.database.catalog_cache import CatalogObject
+from supabase_mcp.services.database.postgres_client import PostgresClient, QueryResult, ResultFormat, StatementResult
 from supabase_mcp.services.database.query_manager import QueryManager
 from supabase_mcp.services.database.sql.loader import SQLLoader
+from supabase_mcp.services.database.sql.models import ParameterizedQuery
 from supabase_mcp.services.database.sql.validator import (
     QueryValidationResults,
     SQLQueryCategory,
@@ -48,7 +52,7 @@ class TestQueryManager:
         )
 
         # Make the validator return our mock validation result
-        query_manager.validator.validate_query.return_value = validation_result
+        query_manager.validator.validate_query_async = AsyncMock(return_value=validation_result)
 
         # Make the db_client return a mock query result
         mock_query_result = MagicMock()
@@ -59,10 +63,18 @@ class TestQueryManager:
         result = await query_manager.handle_query(query)
 
         # Verify the validator was called with the query
-        query_manager.validator.validate_query.assert_called_once_with(query)
+        query_manager.validator.validate_query_async.assert_called_once_with(query)
 
         # Verify the db_client was called with the validation result
-        query_manager.db_client.execute_query.assert_called_once_with(validation_result, False)
+        query_manager.db_client.execute_query.assert_called_once_with(
+            validation_result,
+            False,
+            params=None,
+            max_rows=None,
+            result_format=ResultFormat.ROWS,
+            migration_statements=None,
+            timeout=None,
+        )
 
         # Verify the result is what we expect
         assert result == mock_query_result
@@ -98,7 +110,7 @@ class TestQueryManager:
         )
 
         # Make the validator return our mock validation result
-        query_manager.validator.validate_query.return_value = validation_result
+        query_manager.validator.validate_query_async = AsyncMock(return_value=validation_result)
 
         # Make the safety manager raise a SafetyError
         error_message = "Operation not allowed in SAFE mode"
@@ -113,7 +125,7 @@ class TestQueryManager:
         assert error_message in str(excinfo.value)
 
         # Verify the validator was called with the query
-        query_manager.validator.validate_query.assert_called_once_with(query)
+        query_manager.validator.validate_query_async.assert_called_once_with(query)
 
         # Verify the safety manager was called with the validation result
         query_manager.safety_manager.validate_operation.assert_called_once_with(
@@ -125,23 +137,22 @@ class TestQueryManager:
 
     @pytest.mark.unit
     async def test_get_migrations_query(self, query_manager_integration: QueryManager):
-        """Test that get_migrations_query returns a valid query string."""
+        """Test that get_migrations_query returns a parameterized query with bound arguments."""
         # Test with default parameters
         query = query_manager_integration.get_migrations_query()
-        assert isinstance(query, str)
-        assert "supabase_migrations.schema_migrations" in query
-        assert "LIMIT 50" in query
+        assert isinstance(query, ParameterizedQuery)
+        assert "supabase_migrations.schema_migrations" in query.query
+        assert "LIMIT $3::integer OFFSET $4::integer" in query.query
+        assert query.params == [False, "", 50, 0]
 
         # Test with custom parameters
         custom_query = query_manager_integration.get_migrations_query(
             limit=10, offset=5, name_pattern="test", include_full_queries=True
         )
-        assert isinstance(custom_query, str)
-        assert "supabase_migrations.schema_migrations" in custom_query
-        assert "LIMIT 10" in custom_query
-        assert "OFFSET 5" in custom_query
-        assert "name ILIKE" in custom_query
-        assert "statements" in custom_query  # Should include statements column when include_full_queries=True
+        assert custom_query.query == query.query  # The query text doesn't depend on the arguments
+        assert "name ILIKE" in custom_query.query
+        assert "statements" in custom_query.query  # Should include statements column when include_full_queries=True
+        assert custom_query.params == [True, "test", 10, 5]
 
     @pytest.mark.unit
     async def test_init_migration_schema(self):
@@ -186,8 +197,8 @@ class TestQueryManager:
         assert any(stmt.query and stmt.query in init_query for stmt in validation_result.statements)
 
     @pytest.mark.unit
-    async def test_handle_migration(self):
-        """Test that handle_migration correctly handles migrations when needed."""
+    async def test_prepare_migration(self):
+        """Test that prepare_migration prepares the migration statements when needed."""
         # Create minimal mocks
         postgres_client = MagicMock()
         postgres_client.execute_query = AsyncMock()
@@ -234,13 +245,215 @@ class TestQueryManager:
         )
 
         # Call the method
-        await query_manager.handle_migration(validation_result, "CREATE TABLE test (id INT)", "test_migration")
+        migration = query_manager.prepare_migration(validation_result, "CREATE TABLE test (id INT)", "test_migration")
 
         # Verify that the migration manager was called to prepare the migration query
         migration_manager.prepare_migration_query.assert_called_once_with(
             validation_result, "CREATE TABLE test (id INT)", "test_migration"
         )
 
-        # Verify that execute_query was called at least twice
-        # Once for init_migration_schema and once for the migration query
-        assert postgres_client.execute_query.call_count >= 2
+        # Verify that the statements initialize the migrations schema before inserting the migration
+        assert migration is not None
+        assert migration.name == migration_name
+        assert migration.init_validation is not None
+        assert migration.insert_validation.original_query == migration_query
+        postgres_client.execute_query.assert_not_called()
+
+    @staticmethod
+    def make_migration_query_manager(postgres_client: MagicMock) -> QueryManager:
+        """Create a QueryManager with real validator/loader and a mocked migration manager."""
+        migration_manager = MagicMock()
+        migration_manager.prepare_migration_query.return_value = (
+            "INSERT INTO supabase_migrations.schema_migrations (version, name, statements) "
+            "VALUES ('1', 'test_migration', ARRAY['CREATE TABLE test (id INT)']);",
+            "test_migration",
+        )
+        return QueryManager(
+            postgres_client=postgres_client,
+            safety_manager=MagicMock(),
+            sql_validator=SQLValidator(),
+            sql_loader=SQLLoader(),
+            migration_manager=migration_manager,
+        )
+
+    @staticmethod
+    def make_ddl_validation_result() -> QueryValidationResults:
+        """Create a validation result for a statement that needs a migration."""
+        return QueryValidationResults(
+            statements=[
+                ValidatedStatement(
+                    category=SQLQueryCategory.DDL,
+                    command=SQLQueryCommand.CREATE,
+                    risk_level=OperationRiskLevel.MEDIUM,
+                    query="CREATE TABLE test (id INT)",
+                    needs_migration=True,
+                    object_type="TABLE",
+                    schema_name="public",
+                )
+            ],
+            highest_risk_level=OperationRiskLevel.MEDIUM,
+            original_query="CREATE TABLE test (id INT)",
+        )
+
+    @staticmethod
+    def migration_statement_count(postgres_client: MagicMock) -> int:
+        """Count the migration statements sent with the last query."""
+        return len(postgres_client.execute_query.call_args.kwargs["migration_statements"])
+
+    @pytest.mark.unit
+    async def test_handle_query_records_migration_in_same_transaction(self):
+        """Test that DDL and its migration record are executed in a single execute_query call."""
+        postgres_client = MagicMock()
+        postgres_client.execute_query = AsyncMock(return_value=QueryResult(results=[], migration_recorded=True))
+        query_manager = self.make_migration_query_manager(postgres_client)
+        query = "CREATE TABLE test (id INT);"
+
+        await query_manager.handle_query(query)
+
+        postgres_client.execute_query.assert_called_once()
+        migration_statements = postgres_client.execute_query.call_args.kwargs["migration_statements"]
+        init_query = SQLLoader.get_init_migrations_query()
+        # Schema initialization first, then the migration insert
+        assert len(migration_statements) == 3
+        assert all(statement.query in init_query for statement in migration_statements[:2])
+        assert "INSERT INTO supabase_migrations.schema_migrations" in migration_statements[2].query
+
+        # Once recorded, the schema is known to exist and only the insert is sent
+        await query_manager.handle_query(query)
+        assert self.migration_statement_count(postgres_client) == 1
+
+    @pytest.mark.unit
+    async def test_migration_schema_reinitialized_after_reset(self):
+        """Test that resetting the Postgres client sends the schema initialization with the next migration."""
+        postgres_client = MagicMock()
+        postgres_client.execute_query = AsyncMock(return_value=QueryResult(results=[], migration_recorded=True))
+        query_manager = self.make_migration_query_manager(postgres_client)
+        query = "CREATE TABLE test (id INT);"
+
+        await query_manager.handle_query(query)
+        await query_manager.handle_query(query)
+        assert self.migration_statement_count(postgres_client) == 1
+
+        await PostgresClient.reset()
+        await query_manager.handle_query(query)
+        assert self.migration_statement_count(postgres_client) == 3
+
+    @pytest.mark.unit
+    async def test_handle_query_records_migration_separately_on_failure(self):
+        """Test that a migration not recorded in the query transaction is recorded separately."""
+        postgres_client = MagicMock()
+        query_manager = self.make_migration_query_manager(postgres_client)
+        query_manager._migration_schema_ready.add(postgres_client.project_ref)
+        postgres_client.execute_query = AsyncMock(
+            side_effect=[QueryResult(results=[], migration_recorded=False), QueryResult(results=[])]
+        )
+
+        await query_manager.handle_query("CREATE TABLE test (id INT);")
+
+        # Query with migration, then the migration insert on its own
+        assert postgres_client.execute_query.call_count == 2
+        insert_validation = postgres_client.execute_query.call_args.args[0]
+        assert "INSERT INTO supabase_migrations.schema_migrations" in insert_validation.original_query
+        assert postgres_client.project_ref in query_manager._migration_schema_ready
+
+    @pytest.mark.unit
+    async def test_migration_schema_reinitialized_on_undefined_table(self):
+        """Test that a missing migrations table resets readiness, re-creates the schema and retries."""
+        postgres_client = MagicMock()
+        query_manager = self.make_migration_query_manager(postgres_client)
+        query_manager._migration_schema_ready.add(postgres_client.project_ref)
+
+        missing_table_error = QueryError("relation does not exist")
+        missing_table_error.__cause__ = asyncpg.exceptions.UndefinedTableError("relation does not exist")
+        postgres_client.execute_query = AsyncMock(
+            side_effect=[QueryResult(results=[], migration_recorded=False), missing_table_error, None, None]
+        )
+
+        await query_manager.handle_query("CREATE TABLE test (id INT);")
+
+        # Query with migration, failed insert, schema init, retried insert
+        assert postgres_client.execute_query.call_count == 4
+        init_validation, retried_validation = (
+            call.args[0] for call in postgres_client.execute_query.call_args_list[2:]
+        )
+        assert init_validation.original_query == SQLLoader.get_init_migrations_query()
+        assert "INSERT INTO supabase_migrations.schema_migrations" in retried_validation.original_query
+        assert postgres_client.project_ref in query_manager._migration_schema_ready
+
+        # The schema is known to exist again, so the next migration only sends the insert
+        postgres_client.execute_query = AsyncMock(return_value=QueryResult(results=[], migration_recorded=True))
+        await query_manager.handle_query("CREATE TABLE test (id INT);")
+        assert self.migration_statement_count(postgres_client) == 1
+
+    @pytest.mark.unit
+    async def test_catalog_query_is_cached_until_ddl(self):
+        """Test that catalog queries are served from the cache until DDL touches their schema."""
+        postgres_client = MagicMock()
+        postgres_client.execute_query = AsyncMock(return_value=QueryResult(results=[], migration_recorded=True))
+        query_manager = self.make_migration_query_manager(postgres_client)
+        tables_query = query_manager.get_tables_query("public")
+
+        first = await query_manager.handle_catalog_query(
+            CatalogObject.TABLES, tables_query.query, params=tables_query.params, schema_name="public"
+        )
+        second = await query_manager.handle_catalog_query(
+            CatalogObject.TABLES, tables_query.query, params=tables_query.params, schema_name="public"
+        )
+
+        assert postgres_client.execute_query.call_count == 1
+        assert first.cache_age_seconds is None
+        assert second.cache_age_seconds is not None
+
+        # DDL on the same schema drops the cached result
+        await query_manager.handle_query("CREATE TABLE test (id INT);")
+        await query_manager.handle_catalog_query(
+            CatalogObject.TABLES, tables_query.query, params=tables_query.params, schema_name="public"
+        )
+        assert postgres_client.execute_query.call_count == 3
+
+    @pytest.mark.unit
+    async def test_catalog_query_uses_ttl_of_its_kind(self):
+        """Test that each kind of catalog metadata is cached for its own TTL."""
+        postgres_client = MagicMock()
+        postgres_client.execute_query = AsyncMock(return_value=QueryResult(results=[], migration_recorded=True))
+        query_manager = self.make_migration_query_manager(postgres_client)
+        query_manager.catalog_ttls = {CatalogObject.SCHEMAS: 600.0, CatalogObject.TABLES: 0.0}
+        tables_query = query_manager.get_tables_query("public")
+
+        with patch.object(query_manager.catalog_cache, "put", wraps=query_manager.catalog_cache.put) as put:
+            await query_manager.handle_catalog_query(CatalogObject.SCHEMAS, "SELECT 1;")
+            await query_manager.handle_catalog_query(
+                CatalogObject.TABLES, tables_query.query, params=tables_query.params, schema_name="public"
+            )
+            await query_manager.handle_catalog_query(
+                CatalogObject.TABLES, tables_query.query, params=tables_query.params, schema_name="public"
+            )
+
+        assert [call.kwargs["ttl"] for call in put.call_args_list] == [600.0, 0.0, 0.0]
+        assert postgres_client.execute_query.call_count == 3
+
+    @pytest.mark.unit
+    async def test_default_limit_is_applied_and_reported(self):
+        """Test that SELECTs without a LIMIT get the default limit and their results report it."""
+        postgres_client = MagicMock()
+        postgres_client.execute_query = AsyncMock(
+            side_effect=lambda *args, **kwargs: QueryResult(results=[StatementResult(), StatementResult()])
+        )
+        query_manager = self.make_migration_query_manager(postgres_client)
+        query_manager.default_limit = 100
+        query = "SELECT * FROM events; SELECT * FROM users LIMIT 5;"
+
+        result = await query_manager.handle_query(query, apply_default_limit=True)
+
+        executed = postgres_client.execute_query.call_args.args[0]
+        assert [statement.query for statement in executed.statements] == [
+            "SELECT * FROM events LIMIT 100",
+            "SELECT * FROM users LIMIT 5",
+        ]
+        assert [r.limit_applied for r in result.results] == [100, None]
+        # The cached validation result keeps the original statements
+        assert query_manager.validator.validate_query(query).statements[0].limit_applied is None
+
+        # Internal queries are never limited
+        await query_manager.handle_query(query)
+        assert postgres_client.execute_query.call_args.args[0].statements[0].query == "SELECT * FROM events"
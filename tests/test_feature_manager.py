@@ -0,0 +1,364 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from supabase_mcp.clients.api_client import ApiClient, ApiRoutes, FeatureAccessResponse
+from supabase_mcp.core.feature_access_cache import FeatureAccessCache
+from supabase_mcp.core.feature_manager import FeatureManager
+from supabase_mcp.exceptions import (
+    APIClientError,
+    APIConnectionError,
+    APIError,
+    APIServerError,
+    FeatureAccessError,
+    FeatureTemporaryError,
+)
+from supabase_mcp.tools.manager import ToolName
+
+
+def make_feature_manager(*responses: object, cache: FeatureAccessCache | None = None) -> FeatureManager:
+    api_client = MagicMock()
+    api_client.check_feature_access = AsyncMock(side_effect=list(responses))
+    return FeatureManager(api_client, access_cache=cache)
+
+
+@pytest.mark.unit
+class TestFeatureAccessCache:
+    """Unit tests for the feature access decision cache."""
+
+    def test_grants_and_denials_expire_after_their_ttl(self):
+        """Grants and denials are fresh for their own TTL."""
+        cache = FeatureAccessCache(ttl=300, denied_ttl=60)
+
+        with patch("supabase_mcp.core.feature_access_cache.time.monotonic", side_effect=[0.0, 0.0, 59.0, 61.0, 299.0]):
+            cache.put("execute_postgresql", True)
+            cache.put("get_logs", False)
+            assert cache.get("get_logs") is False
+            assert cache.get("get_logs") is None
+            assert cache.get("execute_postgresql") is True
+
+        assert cache.cache_info() == {"hits": 2, "misses": 1, "stale_hits": 0, "size": 2}
+
+    def test_stale_grants_are_limited_to_grants_within_the_stale_ttl(self):
+        """Only grants younger than the stale TTL can stand in for an unreachable Query API."""
+        cache = FeatureAccessCache(ttl=10, stale_ttl=100)
+
+        with patch("supabase_mcp.core.feature_access_cache.time.monotonic", side_effect=[0.0, 0.0, 50.0, 150.0]):
+            cache.put("execute_postgresql", True)
+            cache.put("get_logs", False)
+            assert cache.get_stale_grant("execute_postgresql") is True
+            assert cache.get_stale_grant("get_logs") is False
+            assert cache.get_stale_grant("execute_postgresql") is False
+
+    def test_denials_are_not_stored_without_denied_ttl(self):
+        """A zero denial TTL disables caching denials."""
+        cache = FeatureAccessCache(denied_ttl=0)
+        cache.put("execute_postgresql", True)
+        cache.put("execute_postgresql", False)
+
+        assert cache.get("execute_postgresql") is None
+        assert cache.cache_info()["size"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="class")
+class TestFeatureManagerAccess:
+    """Unit tests for the feature access checks of the feature manager."""
+
+    async def test_decisions_are_cached(self):
+        """Grants and denials are served from the cache on the next check."""
+        feature_manager = make_feature_manager(
+            FeatureAccessResponse(access_granted=True), FeatureAccessResponse(access_granted=False)
+        )
+
+        await feature_manager.check_feature_access("execute_postgresql")
+        await feature_manager.check_feature_access("execute_postgresql")
+        with pytest.raises(FeatureAccessError):
+            await feature_manager.check_feature_access("get_logs")
+        with pytest.raises(FeatureAccessError):
+            await feature_manager.check_feature_access("get_logs")
+
+        assert feature_manager.api_client.check_feature_access.await_count == 2
+
+    async def test_concurrent_checks_share_one_request(self):
+        """Concurrent checks of the same feature wait for a single Query API request."""
+        release = asyncio.Event()
+
+        async def check_feature_access(feature_name: str) -> FeatureAccessResponse:
+            await release.wait()
+            return FeatureAccessResponse(access_granted=True)
+
+        feature_manager = make_feature_manager()
+        feature_manager.api_client.check_feature_access = AsyncMock(side_effect=check_feature_access)
+
+        checks = [asyncio.create_task(feature_manager.check_feature_access("execute_postgresql")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*checks)
+
+        assert feature_manager.api_client.check_feature_access.await_count == 1
+        assert not feature_manager._pending_checks
+
+    async def test_stale_grant_is_used_when_query_api_is_down(self):
+        """An expired grant keeps the feature available while the Query API fails."""
+        cache = FeatureAccessCache(ttl=0)
+        feature_manager = make_feature_manager(
+            FeatureAccessResponse(access_granted=True),
+            APIServerError("Service unavailable", 503),
+            APIConnectionError("Request timed out"),
+            cache=cache,
+        )
+
+        for _ in range(3):
+            await feature_manager.check_feature_access("execute_postgresql")
+
+        assert feature_manager.api_client.check_feature_access.await_count == 3
+        assert cache.cache_info()["stale_hits"] == 2
+
+    async def test_stale_grant_is_not_used_when_query_api_rejects_the_request(self):
+        """A client error, e.g. a revoked API key, isn't answered with an earlier grant."""
+        cache = FeatureAccessCache(ttl=0)
+        feature_manager = make_feature_manager(
+            FeatureAccessResponse(access_granted=True), APIClientError("Unauthorized", 401), cache=cache
+        )
+
+        await feature_manager.check_feature_access("execute_postgresql")
+        with pytest.raises(FeatureTemporaryError) as api_error:
+            await feature_manager.check_feature_access("execute_postgresql")
+
+        assert api_error.value.status_code == 401
+        assert cache.cache_info()["stale_hits"] == 0
+
+    async def test_errors_without_grant_are_temporary_errors(self):
+        """Without a previous grant, Query API failures are reported as temporary errors."""
+        feature_manager = make_feature_manager(APIError("Service unavailable", 503), RuntimeError("boom"))
+
+        with pytest.raises(FeatureTemporaryError) as api_error:
+            await feature_manager.check_feature_access("execute_postgresql")
+        with pytest.raises(FeatureTemporaryError):
+            await feature_manager.check_feature_access("execute_postgresql")
+
+        assert api_error.value.status_code == 503
+
+    async def test_prefetch_fills_the_cache_in_one_request(self):
+        """Prefetching loads the access to every feature, so checks don't call the Query API."""
+        feature_manager = make_feature_manager()
+        feature_names = feature_manager.feature_names()
+        feature_manager.api_client.check_features_access = AsyncMock(
+            return_value={name: name != "retrieve_logs" for name in feature_names}
+        )
+
+        await feature_manager.prefetch_feature_access()
+        await feature_manager.check_feature_access("execute_postgresql")
+        with pytest.raises(FeatureAccessError):
+            await feature_manager.check_feature_access("retrieve_logs")
+
+        feature_manager.api_client.check_features_access.assert_awaited_once_with(feature_names)
+        feature_manager.api_client.check_feature_access.assert_not_awaited()
+        assert "get_table_schemas" not in feature_names
+
+    async def test_prefetch_ttl_only_applies_to_grants(self):
+        """Prefetched denials keep the denial TTL, so a new subscription isn't missed for the refresh TTL."""
+        cache = FeatureAccessCache(ttl=300, denied_ttl=60)
+        feature_manager = make_feature_manager(cache=cache)
+        feature_manager.api_client.check_features_access = AsyncMock(
+            return_value={"execute_postgresql": True, "retrieve_logs": False}
+        )
+
+        with patch("supabase_mcp.core.feature_access_cache.time.monotonic", side_effect=[0.0, 0.0, 100.0, 100.0]):
+            await feature_manager.prefetch_feature_access(ttl=480)
+            assert cache.get("execute_postgresql") is True
+            assert cache.get("retrieve_logs") is None
+
+    async def test_refresh_stops_without_bulk_route(self):
+        """Without the bulk route, features aren't re-checked one by one every interval."""
+        feature_manager = make_feature_manager()
+        feature_manager.api_client.bulk_access_supported = False
+        feature_manager.api_client.check_features_access = AsyncMock(
+            side_effect=lambda feature_names: dict.fromkeys(feature_names, True)
+        )
+
+        feature_manager.start_access_refresh(interval=0.01)
+        await asyncio.sleep(0.05)
+
+        assert feature_manager._refresh_task.done()
+        feature_manager.api_client.check_features_access.assert_awaited_once()
+        await feature_manager.stop_access_refresh()
+
+    async def test_checks_wait_for_the_startup_prefetch(self):
+        """A check arriving while the access map loads waits for it instead of sending its own request."""
+        release = asyncio.Event()
+
+        async def check_features_access(feature_names: list[str]) -> dict[str, bool]:
+            await release.wait()
+            return dict.fromkeys(feature_names, True)
+
+        feature_manager = make_feature_manager()
+        feature_manager.api_client.check_features_access = AsyncMock(side_effect=check_features_access)
+
+        feature_manager.start_access_refresh(interval=0)
+        await asyncio.sleep(0)
+        check = asyncio.create_task(feature_manager.check_feature_access("execute_postgresql"))
+        await asyncio.sleep(0)
+        release.set()
+        await check
+        await feature_manager.stop_access_refresh()
+
+        feature_manager.api_client.check_feature_access.assert_not_awaited()
+
+    async def test_failed_prefetch_falls_back_to_individual_checks(self):
+        """A failed prefetch leaves features to be checked one by one."""
+        feature_manager = make_feature_manager(FeatureAccessResponse(access_granted=True))
+        feature_manager.api_client.check_features_access = AsyncMock(side_effect=APIError("Service unavailable", 503))
+
+        await feature_manager.prefetch_feature_access()
+        await feature_manager.check_feature_access("execute_postgresql")
+
+        feature_manager.api_client.check_feature_access.assert_awaited_once_with("execute_postgresql")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="class")
+class TestApiClientFeatureAccess:
+    """Unit tests for the bulk feature access check of the Query API client."""
+
+    async def test_bulk_route_returns_access_per_feature(self):
+        """The bulk route answers for every feature in one request."""
+        api_client = ApiClient(query_api_key="key", query_api_url="https://api.example.com")
+        response = {"features": {"a": True, "b": False}}
+        with patch.object(api_client, "execute_request", AsyncMock(return_value=response)) as request:
+            access = await api_client.check_features_access(["a", "b"])
+
+        assert access == {"a": True, "b": False}
+        request.assert_awaited_once()
+        assert request.await_args.kwargs["request_params"] == {"features": "a,b"}
+        assert api_client.bulk_access_supported is True
+
+    async def test_features_missing_from_bulk_response_are_checked_one_by_one(self):
+        """Features the bulk response leaves out are unknown, so only those get a single check."""
+        api_client = ApiClient(query_api_key="key", query_api_url="https://api.example.com")
+        responses = [{"features": {"a": True}}, {"access_granted": True}]
+        with patch.object(api_client, "execute_request", AsyncMock(side_effect=responses)) as request:
+            access = await api_client.check_features_access(["a", "b"])
+
+        assert access == {"a": True, "b": True}
+        assert request.await_count == 2
+        assert request.await_args.kwargs["path"] == ApiRoutes.FEATURES_ACCESS.format(feature_name="b")
+        assert api_client.bulk_access_supported is True
+
+    async def test_falls_back_to_single_checks_without_bulk_route(self):
+        """Without the bulk route, features are checked concurrently one by one from then on."""
+        api_client = ApiClient(query_api_key="key", query_api_url="https://api.example.com")
+        responses = [
+            APIClientError("Not found", 404),
+            {"access_granted": True},
+            {"access_granted": False},
+            {"access_granted": True},
+        ]
+        with patch.object(api_client, "execute_request", AsyncMock(side_effect=responses)) as request:
+            assert await api_client.check_features_access(["a", "b"]) == {"a": True, "b": False}
+            assert await api_client.check_features_access(["a"]) == {"a": True}
+
+        assert request.await_count == 4
+        assert api_client.bulk_access_supported is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="class")
+class TestFeatureManagerSpeculativeExecution:
+    """Unit tests for running read-only tools concurrently with their feature access check."""
+
+    @staticmethod
+    def make_slow_check(feature_manager: FeatureManager, granted: bool) -> asyncio.Event:
+        release = asyncio.Event()
+
+        async def check_feature_access(feature_name: str) -> FeatureAccessResponse:
+            await release.wait()
+            return FeatureAccessResponse(access_granted=granted)
+
+        feature_manager.api_client.check_feature_access = AsyncMock(side_effect=check_feature_access)
+        return release
+
+    async def test_read_only_tool_runs_during_access_check(self):
+        """Read-only tools start before the check completes and return once access is granted."""
+        feature_manager = make_feature_manager()
+        release = self.make_slow_check(feature_manager, granted=True)
+        container = MagicMock()
+        container.sdk_client.return_python_sdk_spec.return_value = "spec"
+
+        call = asyncio.create_task(feature_manager.execute_tool(ToolName.GET_AUTH_ADMIN_METHODS_SPEC, container))
+        await asyncio.sleep(0.01)
+        container.sdk_client.return_python_sdk_spec.assert_called_once()
+        assert not call.done()
+
+        release.set()
+        assert await call == "spec"
+
+    async def test_read_only_tool_work_is_cancelled_on_denial(self):
+        """Denied access cancels the work and never releases its result."""
+        feature_manager = make_feature_manager()
+        release = self.make_slow_check(feature_manager, granted=False)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def handle_catalog_query(*args: object) -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        container = MagicMock()
+        container.query_manager.handle_catalog_query = AsyncMock(side_effect=handle_catalog_query)
+
+        call = asyncio.create_task(feature_manager.execute_tool(ToolName.GET_SCHEMAS, container))
+        await started.wait()
+        release.set()
+
+        with pytest.raises(FeatureAccessError):
+            await call
+        assert cancelled.is_set()
+
+    async def test_ungated_tools_run_without_access_check(self):
+        """Local diagnostics don't depend on a feature and never ask the Query API."""
+        feature_manager = make_feature_manager()
+        container = MagicMock()
+        container.postgres_client.get_pool_stats.return_value = "stats"
+
+        assert await feature_manager.execute_tool(ToolName.GET_POOL_STATS, container) == "stats"
+        feature_manager.api_client.check_feature_access.assert_not_awaited()
+        assert ToolName.GET_POOL_STATS.value not in feature_manager.feature_names()
+
+    async def test_tools_with_side_effects_wait_for_access(self):
+        """Tools that can change state don't start before access is confirmed."""
+        feature_manager = make_feature_manager()
+        release = self.make_slow_check(feature_manager, granted=False)
+        container = MagicMock()
+        container.query_manager.handle_query = AsyncMock()
+
+        call = asyncio.create_task(
+            feature_manager.execute_tool(ToolName.EXECUTE_POSTGRESQL, container, query="SELECT 1;")
+        )
+        await asyncio.sleep(0.01)
+        release.set()
+
+        with pytest.raises(FeatureAccessError):
+            await call
+        container.query_manager.handle_query.assert_not_awaited()
+
+    async def test_api_stats_report_both_clients(self):
+        """The API stats tool reports the request metrics of the Management API and Query API clients."""
+        feature_manager = make_feature_manager()
+        container = MagicMock()
+        container.api_manager.client.get_metrics.return_value = {"GET /v1/projects": "management stats"}
+        container.query_api_client.get_metrics.return_value = {"GET /features/access": "query stats"}
+
+        stats = await feature_manager.execute_tool(ToolName.GET_API_STATS, container)
+
+        assert stats == {
+            "management_api": {"GET /v1/projects": "management stats"},
+            "query_api": {"GET /features/access": "query stats"},
+        }
+        feature_manager.api_client.check_feature_access.assert_not_awaited()
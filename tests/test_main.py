@@ -67,6 +67,7 @@ class TestMain:
             ToolName.GET_SCHEMAS,
             ToolName.GET_TABLES,
             ToolName.GET_TABLE_SCHEMA,
+            ToolName.GET_TABLE_SCHEMAS,
             ToolName.EXECUTE_POSTGRESQL,
             ToolName.CONFIRM_DESTRUCTIVE_OPERATION,
             ToolName.RETRIEVE_MIGRATIONS,
@@ -76,14 +77,16 @@ class TestMain:
             ToolName.GET_AUTH_ADMIN_METHODS_SPEC,
             ToolName.CALL_AUTH_ADMIN_METHOD,
             ToolName.RETRIEVE_LOGS,
+            ToolName.GET_POOL_STATS,
+            ToolName.GET_API_STATS,
         ]
 
         # Verify tools are registered in MCP
         registered_tools = asyncio.run(mcp.list_tools())
         registered_tool_names = {tool.name for tool in registered_tools}
 
-        # We should have exactly 12 tools (all the tools defined in ToolName enum)
-        assert len(registered_tools) == 12, f"Expected 12 tools, but got {len(registered_tools)}"
+        # We should have exactly 15 tools (all the tools defined in ToolName enum)
+        assert len(registered_tools) == 15, f"Expected 15 tools, but got {len(registered_tools)}"
 
         # Log the actual number of tools for reference
         logger.info(f"Found {len(registered_tools)} MCP tools registered")
@@ -3,6 +3,8 @@ from unittest.mock import patch
 import pytest
 from pydantic import ValidationError
 
+from supabase_mcp.core.container import ServicesContainer
+from supabase_mcp.services.database.catalog_cache import CatalogObject
 from supabase_mcp.settings import SUPPORTED_REGIONS, Settings
 
 
@@ -118,3 +120,35 @@ class TestSettings:
             settings = Settings()
             assert settings.supabase_access_token is None
             assert settings.supabase_service_role_key is None
+
+    @pytest.mark.integration
+    def test_settings_pool_sizes(self) -> None:
+        """Test connection pool size settings."""
+        with patch.dict("os.environ", {"DB_POOL_MIN_SIZE": "4", "DB_POOL_MAX_SIZE": "20"}, clear=True):
+            settings = Settings()
+            assert settings.db_pool_min_size == 4
+            assert settings.db_pool_max_size == 20
+
+        # The maximum can't be below the minimum
+        with pytest.raises(ValidationError) as exc_info:
+            with patch.dict("os.environ", {"DB_POOL_MIN_SIZE": "8", "DB_POOL_MAX_SIZE": "4"}, clear=True):
+                Settings()
+        assert "DB_POOL_MAX_SIZE (4) must be at least DB_POOL_MIN_SIZE (8)" in str(exc_info.value)
+
+    @pytest.mark.integration
+    def test_settings_catalog_cache_ttls(self) -> None:
+        """Test that each kind of catalog metadata can have its own TTL."""
+        with patch.dict("os.environ", {}, clear=True):
+            settings = Settings()
+            assert settings.catalog_cache_ttl == 60.0
+            assert settings.catalog_cache_schemas_ttl is None
+            assert ServicesContainer.catalog_ttls(settings) == {}
+
+        env = {"CATALOG_CACHE_SCHEMAS_TTL": "600", "CATALOG_CACHE_TABLE_SCHEMA_TTL": "0"}
+        with patch.dict("os.environ", env, clear=True):
+            settings = Settings()
+            assert ServicesContainer.catalog_ttls(settings) == {
+                CatalogObject.SCHEMAS: 600.0,
+                CatalogObject.TABLE_SCHEMA: 0.0,
+                CatalogObject.TABLE_SCHEMAS: 0.0,
+            }
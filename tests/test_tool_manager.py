@@ -173,11 +173,12 @@ class TestToolManager:
 
         # Verify the total number of tools
         # Update this number when new tools are added
-        expected_tool_count = 12
+        expected_tool_count = 15
         assert len(tool_values) == expected_tool_count, f"Expected {expected_tool_count} tools, got {len(tool_values)}"
 
         # Verify specific tools are included
         assert "retrieve_logs" in tool_values, "retrieve_logs tool is missing from ToolName enum"
+        assert "get_table_schemas" in tool_values, "get_table_schemas tool is missing from ToolName enum"
 
         # Reset the singleton for other tests
         # pylint: disable=protected-access
@@ -5,6 +5,7 @@ from mcp.server.fastmcp import FastMCP
 
 from supabase_mcp.core.container import ServicesContainer
 from supabase_mcp.exceptions import ConfirmationRequiredError, OperationNotAllowedError
+from supabase_mcp.services.database.catalog_cache import CatalogObject
 from supabase_mcp.services.database.postgres_client import QueryResult
 from supabase_mcp.services.safety.models import ClientType, OperationRiskLevel, SafetyMode
 
@@ -44,7 +45,7 @@ class TestDatabaseTools:
 
         # Get the tables query for the public schema
         query = query_manager.get_tables_query("public")
-        result = await query_manager.handle_query(query)
+        result = await query_manager.handle_query(query.query, params=query.params)
 
         # Verify result structure
         assert isinstance(result, QueryResult), "Result should be a QueryResult"
@@ -65,7 +66,7 @@ class TestDatabaseTools:
         """Test the get_table_schema tool retrieves column information for a table."""
         query_manager = initialized_container_integration.query_manager
         query = query_manager.get_tables_query("public")
-        tables_result = await query_manager.handle_query(query)
+        tables_result = await query_manager.handle_query(query.query, params=query.params)
 
         # Skip test if no tables available
         if len(tables_result.results[0].rows) == 0:
@@ -76,7 +77,7 @@ class TestDatabaseTools:
 
         # Execute the get_table_schema tool
         query = query_manager.get_table_schema_query("public", first_table)
-        result = await query_manager.handle_query(query)
+        result = await query_manager.handle_query(query.query, params=query.params)
 
         # Verify result structure
         assert isinstance(result, QueryResult), "Result should be a QueryResult"
@@ -90,6 +91,36 @@ class TestDatabaseTools:
             for field in expected_fields:
                 assert field in first_column, f"Column result missing '{field}' field"
 
+    async def test_get_table_schemas_tool(self, initialized_container_integration: ServicesContainer):
+        """Test the get_table_schemas tool describes every table of a schema grouped per table."""
+        query_manager = initialized_container_integration.query_manager
+        query = query_manager.get_tables_query("public")
+        tables_result = await query_manager.handle_query(query.query, params=query.params)
+        table_names = {row["table_name"] for row in tables_result.results[0].rows}
+
+        # Describe the whole schema in one call
+        query = query_manager.get_table_schemas_query("public")
+        result = await query_manager.handle_catalog_query(
+            CatalogObject.TABLE_SCHEMAS, query.query, params=query.params, schema_name="public", group_by="table_name"
+        )
+
+        # One row per table, each with its columns
+        assert isinstance(result, QueryResult), "Result should be a QueryResult"
+        described = {row["table_name"] for row in result.results[0].rows}
+        assert described >= table_names
+        for row in result.results[0].rows:
+            for column in row["columns"]:
+                for field in ["column_name", "data_type", "is_nullable", "is_primary_key"]:
+                    assert field in column, f"Column result missing '{field}' field"
+
+        # Column types are reported the same way as by get_table_schema
+        if result.results[0].rows:
+            first_table = result.results[0].rows[0]
+            query = query_manager.get_table_schema_query("public", first_table["table_name"])
+            single = await query_manager.handle_query(query.query, params=query.params)
+            single_types = {column["column_name"]: column["data_type"] for column in single.results[0].rows}
+            assert {column["column_name"]: column["data_type"] for column in first_table["columns"]} == single_types
+
     async def test_execute_postgresql_safe_query(self, initialized_container_integration: ServicesContainer):
         """Test the execute_postgresql tool runs safe SQL queries."""
         query_manager = initialized_container_integration.query_manager
@@ -134,7 +165,7 @@ class TestDatabaseTools:
 
         # Case 1: Basic retrieval with default parameters
         query = query_manager.get_migrations_query()
-        basic_result = await query_manager.handle_query(query)
+        basic_result = await query_manager.handle_query(query.query, params=query.params)
 
         # Verify result structure
         assert isinstance(basic_result, QueryResult), "Result should be a QueryResult"
@@ -143,7 +174,7 @@ class TestDatabaseTools:
 
         # Case 2: Test pagination with limit and offset
         query_limited = query_manager.get_migrations_query(limit=3)
-        limited_result = await query_manager.handle_query(query_limited)
+        limited_result = await query_manager.handle_query(query_limited.query, params=query_limited.params)
 
         # Verify limited results
         if limited_result.results[0].rows:
@@ -152,7 +183,7 @@ class TestDatabaseTools:
             # Test offset
             if len(limited_result.results[0].rows) > 0:
                 query_offset = query_manager.get_migrations_query(limit=3, offset=1)
-                offset_result = await query_manager.handle_query(query_offset)
+                offset_result = await query_manager.handle_query(query_offset.query, params=query_offset.params)
 
                 # If we have enough migrations, the first migration with offset should be different
                 if len(limited_result.results[0].rows) > 1 and offset_result.results[0].rows:
@@ -163,7 +194,9 @@ class TestDatabaseTools:
         # Case 3: Test name pattern filtering
         # First get all migrations to find a pattern to search for
         all_migrations_query = query_manager.get_migrations_query(limit=100)
-        all_migrations_result = await query_manager.handle_query(all_migrations_query)
+        all_migrations_result = await query_manager.handle_query(
+            all_migrations_query.query, params=all_migrations_query.params
+        )
 
         # If we have migrations, try to filter by a pattern from an existing migration
         if all_migrations_result.results[0].rows:
@@ -174,7 +207,7 @@ class TestDatabaseTools:
 
                 # Search using the pattern
                 pattern_query = query_manager.get_migrations_query(name_pattern=pattern)
-                pattern_result = await query_manager.handle_query(pattern_query)
+                pattern_result = await query_manager.handle_query(pattern_query.query, params=pattern_query.params)
 
                 # Verify pattern filtering works
                 if pattern_result.results[0].rows:
@@ -185,7 +218,9 @@ class TestDatabaseTools:
 
         # Case 4: Test including full queries
         full_queries_query = query_manager.get_migrations_query(include_full_queries=True, limit=2)
-        full_queries_result = await query_manager.handle_query(full_queries_query)
+        full_queries_result = await query_manager.handle_query(
+            full_queries_query.query, params=full_queries_query.params
+        )
 
         # Verify full queries are included
         if full_queries_result.results[0].rows:
@@ -196,7 +231,7 @@ class TestDatabaseTools:
 
         # Case 5: Test combining multiple parameters
         combined_query = query_manager.get_migrations_query(limit=5, offset=1, include_full_queries=True)
-        combined_result = await query_manager.handle_query(combined_query)
+        combined_result = await query_manager.handle_query(combined_query.query, params=combined_query.params)
 
         # Verify combined parameters work
         if combined_result.results[0].rows: